@@ -12,6 +12,57 @@ from typing import Dict, List, Optional
 class PriorAuthROICalculator:
     """Calculate ROI for prior authorization improvements"""
     
+    # Report layout, filled with str.format_map in generate_roi_report
+    _REPORT_TEMPLATE = """
+Prior Authorization ROI Analysis Report
+=====================================
+
+CURRENT STATE (Administrative Surrender)
+---------------------------------------
+Gross Revenue: ${gross_revenue:,.0f}
+Total Denials: ${total_denials:,.0f}
+PA-Related Denials: ${pa_related_denials:,.0f}
+Currently Appealed: ${amount_appealed:,.0f} ({current_appeal_pct:.1f}%)
+Currently Surrendered: ${amount_surrendered:,.0f} ({surrender_percentage:.1f}%)
+
+IMPROVEMENT OPPORTUNITY
+----------------------
+Additional Revenue Recovery: ${additional_recovery:,.0f}
+Rework Cost Savings: ${rework_savings:,.0f}
+Physician Time Value: ${physician_time_value:,.0f}
+Total Annual Benefit: ${total_annual_benefit:,.0f}
+
+INVESTMENT REQUIRED
+------------------
+P2P Gatekeeper Salary: ${p2p_gatekeeper_salary:,.0f}
+Technology Investment: ${technology_investment:,.0f}
+Training Costs: ${training_costs:,.0f}
+Total Investment: ${total_investment:,.0f}
+
+ROI SUMMARY
+-----------
+First Year ROI: {first_year_roi_pct:.0f}%
+Ongoing Annual ROI: {ongoing_roi_pct:.0f}%
+Payback Period: {payback_months:.1f} months
+Net Benefit Year 1: ${net_benefit_year_1:,.0f}
+
+OPERATIONAL IMPACT
+-----------------
+Denials Prevented Monthly: {denials_prevented_monthly:.0f}
+Physician Hours Saved Annually: {phys_hours_saved:,.0f}
+
+DATA SOURCES
+-----------
+Appeal Success Rate: CMS Medicare Advantage Data 2023 (81.7%)
+Current Appeal Rate: CMS Medicare Advantage Data 2023 (11.7%)
+Rework Costs: HFMA Estimates ($25-$118, using $70 midpoint)
+Physician Time: AMA 2024 Survey (12-13 hours/week)
+
+Note: The administrative surrender calculation is illustrative based on 
+industry averages. Your actual results will vary based on payer mix, 
+service lines, and current operational efficiency.
+"""
+    
     def __init__(self):
         # Constants from verified sources
         self.APPEAL_SUCCESS_RATE = 0.817  # CMS Medicare Advantage Data 2023
@@ -64,7 +115,8 @@ class PriorAuthROICalculator:
     
     def calculate_improvement_roi(self, 
                                  hospital_metrics: Dict,
-                                 improvement_targets: Dict) -> Dict:
+                                 improvement_targets: Dict,
+                                 baseline: Optional[Dict] = None) -> Dict:
         """
         Calculate ROI from PA process improvements
         
@@ -76,12 +128,14 @@ class PriorAuthROICalculator:
                 - p2p_gatekeeper_salary: Annual salary for new role
                 - technology_investment: One-time tech costs
                 - training_costs: One-time training investment
+            baseline: Precomputed calculate_administrative_surrender result (optional)
                 
         Returns:
             Dictionary with comprehensive ROI calculations
         """
         # Get baseline surrender calculations
-        baseline = self.calculate_administrative_surrender(hospital_metrics)
+        if baseline is None:
+            baseline = self.calculate_administrative_surrender(hospital_metrics)
         
         # Get improvement targets
         target_appeal_rate = improvement_targets.get('target_appeal_rate', 0.50)
@@ -130,62 +184,103 @@ class PriorAuthROICalculator:
             'denials_prevented_monthly': denials_prevented_monthly
         }
     
-    def generate_roi_report(self, hospital_metrics: Dict, improvement_targets: Dict) -> str:
-        """Generate a formatted ROI report"""
+    def calculate_improvement_roi_batch(self, scenarios: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized calculate_improvement_roi for large scenario sweeps
+        
+        Args:
+            scenarios: DataFrame with one row per scenario. Columns may be any of the
+                hospital_metrics / improvement_targets keys; missing columns use the
+                same defaults as the single-scenario methods.
+                
+        Returns:
+            DataFrame with the calculate_improvement_roi fields, one row per scenario
+        """
+        defaults = {
+            'gross_revenue': 450_000_000,
+            'denial_rate': 0.08,
+            'pa_denial_percentage': 0.25,
+            'num_physicians': 100,
+            'target_appeal_rate': 0.50,
+            'denial_reduction': 0.30,
+            'p2p_gatekeeper_salary': 95_000,
+            'technology_investment': 50_000,
+            'training_costs': 25_000
+        }
+        df = pd.DataFrame({
+            key: scenarios[key] if key in scenarios else default
+            for key, default in defaults.items()
+        }, index=scenarios.index, dtype=np.float64)
+        
+        hours_saved_per_physician = self.PHYSICIAN_HOURS_WEEKLY * 0.5 * 52  # 50% reduction
+        
+        # DataFrame.eval routes through numexpr when installed (blocked, multi-threaded)
+        df.eval("""
+        pa_related_denials = gross_revenue * denial_rate * pa_denial_percentage
+        baseline_surrender = pa_related_denials * (1 - @self.CURRENT_APPEAL_RATE)
+        additional_recovery = pa_related_denials * (target_appeal_rate - @self.CURRENT_APPEAL_RATE) * @self.APPEAL_SUCCESS_RATE
+        denials_prevented_monthly = pa_related_denials / 12 / gross_revenue * 1000000 * denial_reduction
+        rework_savings = denials_prevented_monthly * 12 * @self.COST_PER_REWORK_MID
+        physician_time_value = @hours_saved_per_physician * num_physicians * @self.PHYSICIAN_HOURLY_RATE
+        total_annual_benefit = additional_recovery + rework_savings
+        total_investment = p2p_gatekeeper_salary + technology_investment + training_costs
+        first_year_roi_pct = (total_annual_benefit - total_investment) / total_investment * 100
+        ongoing_roi_pct = (total_annual_benefit - p2p_gatekeeper_salary) / p2p_gatekeeper_salary * 100
+        payback_months = total_investment / (total_annual_benefit / 12)
+        net_benefit_year_1 = total_annual_benefit - total_investment
+        """, inplace=True)
+        
+        return df[['baseline_surrender', 'additional_recovery', 'rework_savings',
+                   'physician_time_value', 'total_annual_benefit', 'total_investment',
+                   'first_year_roi_pct', 'ongoing_roi_pct', 'payback_months',
+                   'net_benefit_year_1', 'denials_prevented_monthly']]
+    
+    def run_analysis(self,
+                     hospital_metrics: Dict,
+                     improvement_targets: Dict,
+                     format_report: bool = True) -> Dict:
+        """
+        Compute baseline and ROI once, optionally rendering the text report
         
+        Args:
+            hospital_metrics: Same as calculate_administrative_surrender
+            improvement_targets: Same as calculate_improvement_roi
+            format_report: Set False in sweeps to skip report rendering
+            
+        Returns:
+            Dictionary with 'baseline', 'roi' and 'report' (None when not formatted)
+        """
         baseline = self.calculate_administrative_surrender(hospital_metrics)
-        roi = self.calculate_improvement_roi(hospital_metrics, improvement_targets)
+        roi = self.calculate_improvement_roi(hospital_metrics, improvement_targets, baseline=baseline)
+        report = (self.generate_roi_report(hospital_metrics, improvement_targets, baseline=baseline, roi=roi)
+                  if format_report else None)
         
-        report = f"""
-Prior Authorization ROI Analysis Report
-=====================================
-
-CURRENT STATE (Administrative Surrender)
----------------------------------------
-Gross Revenue: ${baseline['gross_revenue']:,.0f}
-Total Denials: ${baseline['total_denials']:,.0f}
-PA-Related Denials: ${baseline['pa_related_denials']:,.0f}
-Currently Appealed: ${baseline['amount_appealed']:,.0f} ({self.CURRENT_APPEAL_RATE*100:.1f}%)
-Currently Surrendered: ${baseline['amount_surrendered']:,.0f} ({baseline['surrender_percentage']:.1f}%)
-
-IMPROVEMENT OPPORTUNITY
-----------------------
-Additional Revenue Recovery: ${roi['additional_recovery']:,.0f}
-Rework Cost Savings: ${roi['rework_savings']:,.0f}
-Physician Time Value: ${roi['physician_time_value']:,.0f}
-Total Annual Benefit: ${roi['total_annual_benefit']:,.0f}
-
-INVESTMENT REQUIRED
-------------------
-P2P Gatekeeper Salary: ${improvement_targets.get('p2p_gatekeeper_salary', 95000):,.0f}
-Technology Investment: ${improvement_targets.get('technology_investment', 50000):,.0f}
-Training Costs: ${improvement_targets.get('training_costs', 25000):,.0f}
-Total Investment: ${roi['total_investment']:,.0f}
-
-ROI SUMMARY
------------
-First Year ROI: {roi['first_year_roi_pct']:.0f}%
-Ongoing Annual ROI: {roi['ongoing_roi_pct']:.0f}%
-Payback Period: {roi['payback_months']:.1f} months
-Net Benefit Year 1: ${roi['net_benefit_year_1']:,.0f}
-
-OPERATIONAL IMPACT
------------------
-Denials Prevented Monthly: {roi['denials_prevented_monthly']:.0f}
-Physician Hours Saved Annually: {hospital_metrics.get('num_physicians', 100) * self.PHYSICIAN_HOURS_WEEKLY * 0.5 * 52:,.0f}
-
-DATA SOURCES
------------
-Appeal Success Rate: CMS Medicare Advantage Data 2023 (81.7%)
-Current Appeal Rate: CMS Medicare Advantage Data 2023 (11.7%)
-Rework Costs: HFMA Estimates ($25-$118, using $70 midpoint)
-Physician Time: AMA 2024 Survey (12-13 hours/week)
-
-Note: The administrative surrender calculation is illustrative based on 
-industry averages. Your actual results will vary based on payer mix, 
-service lines, and current operational efficiency.
-"""
-        return report
+        return {'baseline': baseline, 'roi': roi, 'report': report}
+    
+    def generate_roi_report(self,
+                            hospital_metrics: Dict,
+                            improvement_targets: Dict,
+                            baseline: Optional[Dict] = None,
+                            roi: Optional[Dict] = None) -> str:
+        """Generate a formatted ROI report, reusing precomputed baseline/ROI dicts when given"""
+        
+        if baseline is None:
+            baseline = self.calculate_administrative_surrender(hospital_metrics)
+        if roi is None:
+            roi = self.calculate_improvement_roi(hospital_metrics, improvement_targets, baseline=baseline)
+        
+        # Flat context for the precompiled template
+        ctx = {
+            **baseline,
+            **roi,
+            'p2p_gatekeeper_salary': improvement_targets.get('p2p_gatekeeper_salary', 95000),
+            'technology_investment': improvement_targets.get('technology_investment', 50000),
+            'training_costs': improvement_targets.get('training_costs', 25000),
+            'current_appeal_pct': self.CURRENT_APPEAL_RATE * 100,
+            'phys_hours_saved': hospital_metrics.get('num_physicians', 100) * self.PHYSICIAN_HOURS_WEEKLY * 0.5 * 52
+        }
+        
+        return self._REPORT_TEMPLATE.format_map(ctx)
 
 
 # Example usage
@@ -209,10 +304,10 @@ if __name__ == "__main__":
         'training_costs': 25_000
     }
     
-    # Generate report
-    report = calculator.generate_roi_report(hospital_metrics, improvement_targets)
-    print(report)
+    # Compute once and generate report
+    analysis = calculator.run_analysis(hospital_metrics, improvement_targets)
+    print(analysis['report'])
     
-    # You can also get raw calculations
-    roi_data = calculator.calculate_improvement_roi(hospital_metrics, improvement_targets)
+    # You can also get raw calculations (pass format_report=False to skip the report)
+    roi_data = analysis['roi']
     print(f"\nQuick Summary: ${roi_data['net_benefit_year_1']:,.0f} net benefit in Year 1")
\ No newline at end of file
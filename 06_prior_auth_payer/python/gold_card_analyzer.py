@@ -10,10 +10,21 @@ from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+try:
+    import polars as pl
+except ImportError:  # optional multi-threaded backend
+    pl = None
+
 class GoldCardAnalyzer:
     """Analyze provider performance for gold card eligibility"""
     
-    def __init__(self, approval_threshold=0.92, min_volume_threshold=50):
+    def __init__(self, approval_threshold=0.92, min_volume_threshold=50, backend='pandas'):
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"backend must be 'pandas' or 'polars', got {backend!r}")
+        if backend == 'polars' and pl is None:
+            raise ImportError("backend='polars' requires the polars and pyarrow packages")
+        
+        self.backend = backend
         self.approval_threshold = approval_threshold
         self.min_volume_threshold = min_volume_threshold
         self.eligibility_criteria = {
@@ -28,8 +39,11 @@ class GoldCardAnalyzer:
         Calculate comprehensive provider performance metrics
         
         Parameters:
-        pa_data: DataFrame with PA transaction data
+        pa_data: DataFrame with PA transaction data (pandas, or polars with backend='polars')
         """
+        if self.backend == 'polars':
+            return self._calculate_provider_metrics_polars(pa_data)
+        
         # Group by provider
         provider_metrics = pa_data.groupby('provider_id').agg({
             'pa_id': 'count',
@@ -55,11 +69,12 @@ class GoldCardAnalyzer:
             (provider_metrics['last_pa_date'] - provider_metrics['first_pa_date']).dt.days / 30.44
         )
         
-        provider_metrics['appeal_overturn_rate'] = np.where(
-            provider_metrics['total_appeals'] > 0,
-            provider_metrics['overturned_appeals'] / provider_metrics['total_appeals'],
-            0
-        )
+        # Masked divide: zero-appeal providers are skipped rather than computed as NaN and overwritten
+        total_appeals = provider_metrics['total_appeals'].to_numpy(dtype=np.float64)
+        appeal_overturn_rate = np.zeros_like(total_appeals)
+        np.divide(provider_metrics['overturned_appeals'].to_numpy(dtype=np.float64), total_appeals,
+                  out=appeal_overturn_rate, where=total_appeals > 0)
+        provider_metrics['appeal_overturn_rate'] = appeal_overturn_rate
         
         # Calculate consistency score (low variance in monthly approval rates)
         monthly_consistency = self._calculate_monthly_consistency(pa_data)
@@ -82,49 +97,95 @@ class GoldCardAnalyzer:
         ]).reset_index()
         
         consistency.columns = ['provider_id', 'approval_std', 'approval_mean']
-        consistency['consistency_score'] = 1 - (consistency['approval_std'] / consistency['approval_mean']).fillna(0)
+        # Single-month providers (NaN std) and zero means keep a coefficient of variation of 0
+        approval_std = consistency['approval_std'].to_numpy(dtype=np.float64)
+        approval_mean = consistency['approval_mean'].to_numpy(dtype=np.float64)
+        variation = np.zeros_like(approval_std)
+        np.divide(approval_std, approval_mean, out=variation,
+                  where=~np.isnan(approval_std) & (approval_mean != 0))
+        consistency['consistency_score'] = 1 - variation
         
         return consistency[['provider_id', 'consistency_score']]
     
+    @staticmethod
+    def _to_polars(data):
+        """Accept either a pandas or polars frame on the polars backend"""
+        return data if isinstance(data, pl.DataFrame) else pl.from_pandas(data)
+    
+    def _calculate_provider_metrics_polars(self, pa_data):
+        """Polars implementation of calculate_provider_metrics; returns pandas"""
+        pa_data = self._to_polars(pa_data)
+        approved = pl.col('status').eq_missing('APPROVED')
+        
+        provider_metrics = pa_data.group_by('provider_id').agg(
+            pl.col('pa_id').count().cast(pl.Int64).alias('total_pas'),
+            approved.mean().alias('approval_rate'),
+            pl.col('member_id').drop_nulls().n_unique().cast(pl.Int64).alias('unique_members'),
+            pl.col('service_code').drop_nulls().n_unique().cast(pl.Int64).alias('service_variety'),
+            pl.col('created_date').min().alias('first_pa_date'),
+            pl.col('created_date').max().alias('last_pa_date'),
+            pl.col('appeal_flag').sum().alias('total_appeals'),
+            pl.col('appeal_overturned').sum().alias('overturned_appeals'),
+            pl.col('processing_hours').mean().alias('avg_processing_hours'),
+            pl.col('documentation_complete').mean().alias('doc_completeness')
+        ).sort('provider_id').with_columns(
+            ((pl.col('last_pa_date') - pl.col('first_pa_date')).dt.total_days() / 30.44).alias('months_active'),
+            pl.when(pl.col('total_appeals') > 0)
+              .then(pl.col('overturned_appeals') / pl.col('total_appeals'))
+              .otherwise(0.0)
+              .alias('appeal_overturn_rate')
+        )
+        
+        # Calculate consistency score (low variance in monthly approval rates)
+        monthly_consistency = self._calculate_monthly_consistency_polars(pa_data)
+        provider_metrics = provider_metrics.join(monthly_consistency, on='provider_id', how='left')
+        
+        return provider_metrics.to_pandas()
+    
+    def _calculate_monthly_consistency_polars(self, pa_data):
+        """Polars implementation of _calculate_monthly_consistency"""
+        monthly_approval = pa_data.group_by(
+            'provider_id',
+            pl.col('created_date').dt.truncate('1mo').alias('month')
+        ).agg(
+            pl.col('status').eq_missing('APPROVED').mean().alias('status')
+        )
+        
+        return monthly_approval.group_by('provider_id').agg(
+            (1 - (pl.col('status').std() / pl.col('status').mean()).fill_nan(0).fill_null(0))
+              .alias('consistency_score')
+        )
+    
     def determine_eligibility(self, provider_metrics):
         """
         Determine gold card eligibility for each provider
         """
-        provider_metrics = provider_metrics.copy()
-        
-        # Initialize eligibility columns
-        provider_metrics['eligibility_tier'] = 'NOT_ELIGIBLE'
-        provider_metrics['gold_card_score'] = 0
-        provider_metrics['recommended_services'] = 'NONE'
-        
-        for index, provider in provider_metrics.iterrows():
-            # Check each tier
-            for tier, criteria in self.eligibility_criteria.items():
-                if (provider['approval_rate'] >= criteria['approval_rate'] and
-                    provider['total_pas'] >= criteria['min_volume'] and
-                    provider['months_active'] >= criteria['min_months']):
-                    
-                    provider_metrics.at[index, 'eligibility_tier'] = tier.upper()
-                    break
-            
-            # Calculate gold card score (0-100)
-            score = self._calculate_gold_card_score(provider)
-            provider_metrics.at[index, 'gold_card_score'] = score
-            
-            # Recommend service scope
-            if score >= 90:
-                provider_metrics.at[index, 'recommended_services'] = 'ALL_SERVICES'
-            elif score >= 80:
-                provider_metrics.at[index, 'recommended_services'] = 'HIGH_VOLUME_SERVICES'
-            elif score >= 70:
-                provider_metrics.at[index, 'recommended_services'] = 'ROUTINE_SERVICES'
-            else:
-                provider_metrics.at[index, 'recommended_services'] = 'NONE'
+        # new columns only, no chained-indexing writes
+        # Check each tier in priority order; first match wins
+        tier_conditions = [
+            (provider_metrics['approval_rate'] >= criteria['approval_rate']) &
+            (provider_metrics['total_pas'] >= criteria['min_volume']) &
+            (provider_metrics['months_active'] >= criteria['min_months'])
+            for criteria in self.eligibility_criteria.values()
+        ]
+        tier_labels = [tier.upper() for tier in self.eligibility_criteria]
+        provider_metrics['eligibility_tier'] = np.select(tier_conditions, tier_labels, default='NOT_ELIGIBLE')
+        
+        # Calculate gold card score (0-100)
+        score = self._calculate_gold_card_score(provider_metrics)
+        provider_metrics['gold_card_score'] = score
+        
+        # Recommend service scope
+        provider_metrics['recommended_services'] = np.select(
+            [score >= 90, score >= 80, score >= 70],
+            ['ALL_SERVICES', 'HIGH_VOLUME_SERVICES', 'ROUTINE_SERVICES'],
+            default='NONE'
+        )
         
         return provider_metrics
     
     def _calculate_gold_card_score(self, provider):
-        """Calculate composite gold card score"""
+        """Calculate composite gold card score for a provider row or a whole metrics frame"""
         # Weighted scoring
         weights = {
             'approval_rate': 0.4,
@@ -137,16 +198,16 @@ class GoldCardAnalyzer:
         # Normalize metrics to 0-100 scale
         scores = {
             'approval_rate': provider['approval_rate'] * 100,
-            'volume': min(provider['total_pas'] / 500, 1) * 100,
+            'volume': np.minimum(provider['total_pas'] / 500, 1) * 100,
             'consistency': provider.get('consistency_score', 0.8) * 100,
             'documentation': provider.get('doc_completeness', 0.9) * 100,
-            'efficiency': max(0, 100 - provider.get('avg_processing_hours', 10) * 5)
+            'efficiency': np.maximum(0, 100 - provider.get('avg_processing_hours', 10) * 5)
         }
         
         # Calculate weighted score
         total_score = sum(scores[metric] * weight for metric, weight in weights.items())
         
-        return round(total_score, 1)
+        return np.round(total_score, 1)
     
     def analyze_service_patterns(self, pa_data, eligible_providers):
         """
@@ -154,6 +215,9 @@ class GoldCardAnalyzer:
         """
         eligible_ids = eligible_providers['provider_id'].tolist()
         
+        if self.backend == 'polars':
+            return self._analyze_service_patterns_polars(pa_data, eligible_ids)
+        
         # Filter to eligible providers
         eligible_pa_data = pa_data[pa_data['provider_id'].isin(eligible_ids)]
         
@@ -173,35 +237,62 @@ class GoldCardAnalyzer:
         
         return service_analysis
     
+    def _analyze_service_patterns_polars(self, pa_data, eligible_ids):
+        """Polars implementation of analyze_service_patterns; returns pandas"""
+        service_analysis = self._to_polars(pa_data).filter(
+            pl.col('provider_id').is_in(eligible_ids)
+        ).group_by('provider_id', 'service_code').agg(
+            pl.col('pa_id').count().cast(pl.Int64).alias('volume'),
+            pl.col('status').eq_missing('APPROVED').mean().alias('approval_rate')
+        ).sort('provider_id', 'service_code').with_columns(
+            ((pl.col('approval_rate') >= 0.95) & (pl.col('volume') >= 10)).alias('gold_card_eligible')
+        )
+        
+        return service_analysis.to_pandas()
+    
     def calculate_impact(self, provider_metrics, cost_per_manual_pa=14.49, cost_per_auto_pa=1.50):
         """
         Calculate financial and operational impact of gold carding
         """
-        eligible = provider_metrics[provider_metrics['eligibility_tier'] != 'NOT_ELIGIBLE'].copy()
+        # Boolean indexing already returns a new frame; it is only read below
+        eligible = provider_metrics[provider_metrics['eligibility_tier'] != 'NOT_ELIGIBLE']
         
-        # Calculate savings
-        eligible['annual_pas'] = eligible['total_pas'] * 12 / eligible['months_active']
-        eligible['current_cost'] = eligible['annual_pas'] * cost_per_manual_pa
-        eligible['future_cost'] = eligible['annual_pas'] * cost_per_auto_pa
-        eligible['annual_savings'] = eligible['current_cost'] - eligible['future_cost']
+        # Calculate savings in one pass over the raw arrays (no intermediate frame columns)
+        total_pas = eligible['total_pas'].to_numpy(dtype=np.float64)
+        months_active = eligible['months_active'].to_numpy(dtype=np.float64)
+        annual_pas = total_pas * 12 / months_active
+        annual_savings = (cost_per_manual_pa - cost_per_auto_pa) * annual_pas
         
         # Summary metrics
         impact_summary = {
             'total_eligible_providers': len(eligible),
             'total_providers_analyzed': len(provider_metrics),
             'eligibility_rate': len(eligible) / len(provider_metrics) * 100,
-            'total_pa_volume': eligible['annual_pas'].sum(),
-            'total_annual_savings': eligible['annual_savings'].sum(),
+            'total_pa_volume': float(np.nansum(annual_pas)),
+            'total_annual_savings': float(np.nansum(annual_savings)),
             'avg_processing_time_reduction': eligible['avg_processing_hours'].mean() * 0.9,
             'member_impact': eligible['unique_members'].sum()
         }
         
         # Breakdown by tier
-        tier_summary = eligible.groupby('eligibility_tier').agg({
-            'provider_id': 'count',
-            'annual_pas': 'sum',
-            'annual_savings': 'sum'
-        }).reset_index()
+        tier_columns = {
+            'eligibility_tier': eligible['eligibility_tier'].to_numpy(),
+            'provider_id': eligible['provider_id'].to_numpy(),
+            'annual_pas': annual_pas,
+            'annual_savings': annual_savings
+        }
+        if self.backend == 'polars':
+            tier_summary = pl.DataFrame(tier_columns).group_by('eligibility_tier').agg(
+                pl.col('provider_id').count().cast(pl.Int64),
+                pl.col('annual_pas').sum(),
+                pl.col('annual_savings').sum()
+            ).sort('eligibility_tier').to_pandas()
+        else:
+            tier_summary = pd.DataFrame(tier_columns).groupby('eligibility_tier').agg(
+                provider_id=('provider_id', 'count'),
+                annual_pas=('annual_pas', 'sum'),
+                annual_savings=('annual_savings', 'sum')
+            ).reset_index()
         
         impact_summary['tier_breakdown'] = tier_summary
         
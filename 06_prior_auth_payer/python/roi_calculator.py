@@ -7,8 +7,46 @@ Calculates potential savings from PA automation initiatives
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import matplotlib
 import matplotlib.pyplot as plt
-import seaborn as sns
+from functools import lru_cache
+
+# Copy-on-Write: filtered frames and .assign() share unchanged column buffers
+# instead of copying them (always on from pandas 3.0)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+
+def _aligned_method_arrays(cost_items, time_items):
+    """Method index and cost/time arrays aligned to ordered (method, value) cost items"""
+    processing_times = dict(time_items)
+    method_index = {method: i for i, (method, _) in enumerate(cost_items)}
+    cost_arr = np.array([cost for _, cost in cost_items])
+    ptime_arr = np.array([processing_times.get(m, 0) for m in method_index])
+    return method_index, cost_arr, ptime_arr
+
+
+@lru_cache(maxsize=128)
+def _current_state_core(volume_items, cost_items, time_items):
+    """
+    Numeric core of calculate_current_state, memoized on the ordered
+    (method, value) items of the volumes, costs and processing times;
+    returns immutable tuples so cached results can't be modified
+    """
+    method_index, cost_arr, ptime_arr = _aligned_method_arrays(cost_items, time_items)
+    
+    # Align known methods (in input order) to the cost/time arrays
+    methods = tuple(m for m, _ in volume_items if m in method_index)
+    idx = np.array([method_index[m] for m in methods], dtype=np.intp)
+    vols = np.asarray([v for m, v in volume_items if m in method_index])
+    
+    unit_costs = cost_arr[idx]
+    costs_vec = vols * unit_costs
+    hours_vec = vols * ptime_arr[idx]
+    
+    return (methods, tuple(unit_costs.tolist()), tuple(costs_vec.tolist()),
+            tuple(hours_vec.tolist()), costs_vec.sum().item(), vols.sum().item())
+
 
 class PriorAuthROICalculator:
     """Calculate ROI for prior authorization automation initiatives"""
@@ -44,21 +82,23 @@ class PriorAuthROICalculator:
         Parameters:
         pa_volumes: dict with keys as methods and values as annual volumes
         """
-        current_costs = {}
-        total_cost = 0
-        total_volume = 0
-        
-        for method, volume in pa_volumes.items():
-            if method in self.costs:
-                cost = volume * self.costs[method]
-                current_costs[method] = {
-                    'volume': volume,
-                    'unit_cost': self.costs[method],
-                    'total_cost': cost,
-                    'processing_hours': volume * self.processing_times.get(method, 0)
-                }
-                total_cost += cost
-                total_volume += volume
+        key = (tuple(pa_volumes.items()), tuple(self.costs.items()),
+               tuple(self.processing_times.items()))
+        try:
+            core = _current_state_core(*key)
+        except TypeError:  # unhashable volume values
+            core = _current_state_core.__wrapped__(*key)
+        methods, unit_costs, costs, hours, total_cost, total_volume = core
+        
+        current_costs = {
+            method: {
+                'volume': pa_volumes[method],
+                'unit_cost': unit_cost,
+                'total_cost': cost,
+                'processing_hours': method_hours
+            }
+            for method, unit_cost, cost, method_hours in zip(methods, unit_costs, costs, hours)
+        }
         
         current_costs['summary'] = {
             'total_volume': total_volume,
@@ -68,6 +108,11 @@ class PriorAuthROICalculator:
         
         return current_costs
     
+    def _method_arrays(self):
+        """Method index and cost/time arrays aligned to the current cost and time dicts"""
+        return _aligned_method_arrays(tuple(self.costs.items()),
+                                      tuple(self.processing_times.items()))
+    
     def calculate_automation_scenario(self, current_volumes, automation_targets):
         """
         Calculate savings from automation
@@ -76,24 +121,28 @@ class PriorAuthROICalculator:
         current_volumes: dict of current PA volumes by method
         automation_targets: dict with conversion percentages
         """
-        future_volumes = current_volumes.copy()
+        # Method order: current methods, then new conversion targets as they appear
+        sources = [m for m in automation_targets if m in current_volumes]
+        methods = list(dict.fromkeys(
+            [*current_volumes, *(t for m in sources for t in automation_targets[m])]
+        ))
+        index = {method: i for i, method in enumerate(methods)}
+        
+        # Transition matrix: T[i, j] is the share of method i's volume moved to method j
+        transitions = np.eye(len(methods))
+        for source_method in sources:
+            i = index[source_method]
+            for target_method, percentage in automation_targets[source_method].items():
+                transitions[i, index[target_method]] += percentage
+                transitions[i, i] -= percentage
         
         # Apply automation targets
-        for source_method, conversions in automation_targets.items():
-            if source_method in future_volumes:
-                source_volume = current_volumes[source_method]
-                
-                for target_method, percentage in conversions.items():
-                    conversion_volume = source_volume * percentage
-                    future_volumes[source_method] -= conversion_volume
-                    
-                    if target_method not in future_volumes:
-                        future_volumes[target_method] = 0
-                    future_volumes[target_method] += conversion_volume
-        
-        # Calculate future state
+        current_vec = np.array([current_volumes.get(m, 0) for m in methods], dtype=np.float64)
+        future_vec = current_vec @ transitions
+        
+        # Calculate future state as an update of the current one
         current_state = self.calculate_current_state(current_volumes)
-        future_state = self.calculate_current_state(future_volumes)
+        future_state = self._apply_volume_delta(current_state, methods, future_vec, future_vec - current_vec)
         
         # Calculate savings
         savings = {
@@ -105,6 +154,41 @@ class PriorAuthROICalculator:
         
         return savings
     
+    def _apply_volume_delta(self, current_state, methods, future_vec, delta_vec):
+        """
+        Derive the future state from the current one, recomputing only methods whose volume changed
+        """
+        method_index, cost_arr, ptime_arr = self._method_arrays()
+        known = [i for i, m in enumerate(methods) if m in method_index]
+        cost_idx = np.array([method_index[methods[i]] for i in known], dtype=np.intp)
+        delta_known = delta_vec[np.array(known, dtype=np.intp)]
+        
+        future_state = {}
+        for i, c, delta in zip(known, cost_idx.tolist(), delta_known.tolist()):
+            method = methods[i]
+            if delta == 0 and method in current_state:
+                future_state[method] = dict(current_state[method])
+            else:
+                volume = future_vec[i].item()
+                future_state[method] = {
+                    'volume': volume,
+                    'unit_cost': cost_arr[c].item(),
+                    'total_cost': volume * cost_arr[c].item(),
+                    'processing_hours': volume * ptime_arr[c].item()
+                }
+        
+        # Totals move only by the changed volume
+        summary = current_state['summary']
+        total_cost = summary['total_cost'] + (delta_known @ cost_arr[cost_idx]).item()
+        total_volume = summary['total_volume'] + delta_known.sum().item()
+        future_state['summary'] = {
+            'total_volume': total_volume,
+            'total_cost': total_cost,
+            'average_cost': total_cost / total_volume if total_volume > 0 else 0
+        }
+        
+        return future_state
+    
     def calculate_gold_card_impact(self, provider_data):
         """
         Calculate savings from gold-carding providers
@@ -121,7 +205,7 @@ class PriorAuthROICalculator:
             if not all(col in provider_data.columns for col in required_columns):
                 raise ValueError(f"Provider data must contain columns: {required_columns}")
             
-            eligible_providers = provider_data[provider_data['approval_rate'] >= gold_card_threshold].copy()
+            eligible_providers = provider_data.loc[provider_data['approval_rate'] >= gold_card_threshold]
         
         except Exception as e:
             print(f"Error in gold card calculation: {str(e)}")
@@ -137,9 +221,11 @@ class PriorAuthROICalculator:
             }
         
         # Calculate savings (manual to automated)
-        eligible_providers['current_cost'] = eligible_providers['annual_pas'] * self.costs['manual_fax']
-        eligible_providers['automated_cost'] = eligible_providers['annual_pas'] * self.costs['ai_automated']
-        eligible_providers['savings'] = eligible_providers['current_cost'] - eligible_providers['automated_cost']
+        eligible_providers = eligible_providers.assign(
+            current_cost=lambda d: d['annual_pas'] * self.costs['manual_fax'],
+            automated_cost=lambda d: d['annual_pas'] * self.costs['ai_automated'],
+            savings=lambda d: d['current_cost'] - d['automated_cost']
+        )
         
         summary = {
             'eligible_providers': len(eligible_providers),
@@ -186,9 +272,9 @@ class PriorAuthROICalculator:
         
         return roi
     
-    def generate_roi_report(self, current_volumes, automation_targets, timeline_weeks=8):
+    def compute_roi(self, current_volumes, automation_targets, timeline_weeks=8):
         """
-        Generate comprehensive ROI report with visualizations
+        Calculate ROI figures and chart data without building any plots
         """
         # Calculate scenarios
         automation_roi = self.calculate_automation_scenario(current_volumes, automation_targets)
@@ -200,8 +286,34 @@ class PriorAuthROICalculator:
         weekly_savings = automation_roi['annual_cost_savings'] / 52
         cumulative_savings = adoption_curve * weekly_savings * weeks
         
-        # Create visualization
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+        # Volume distribution (current vs future)
+        labels = [m for m in current_volumes if m in automation_roi['current_state'] and m != 'summary']
+        current_vols = [automation_roi['current_state'][m]['volume'] for m in labels]
+        future_vols = [automation_roi['future_state'][m]['volume'] for m in labels]
+        
+        # ROI metrics
+        metrics = {
+            'Annual Savings': f"${automation_roi['annual_cost_savings']:,.0f}",
+            'Cost Reduction': f"{automation_roi['cost_reduction_percentage']:.1f}%",
+            'Break-even': f"{timeline_weeks/4:.1f} months",
+            'Year 1 ROI': f"{automation_roi['annual_cost_savings']/100000:.1f}x"
+        }
+        
+        return {
+            'automation_roi': automation_roi,
+            'metrics': metrics,
+            'weeks': weeks,
+            'cumulative_savings': cumulative_savings,
+            'volume_labels': labels,
+            'current_volumes': current_vols,
+            'future_volumes': future_vols
+        }
+    
+    def render_roi_report(self, result, save_path=None):
+        """
+        Build the 4-panel ROI figure from a compute_roi result
+        """
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10), constrained_layout=True)
         
         # 1. Cost comparison
         methods = list(self.costs.keys())
@@ -212,20 +324,11 @@ class PriorAuthROICalculator:
         ax1.set_xticklabels(methods, rotation=45)
         
         # 2. Volume distribution (current vs future)
-        current_vols = []
-        future_vols = []
-        labels = []
-        
-        for method in current_volumes.keys():
-            if method in automation_roi['current_state'] and method != 'summary':
-                labels.append(method)
-                current_vols.append(automation_roi['current_state'][method]['volume'])
-                future_vols.append(automation_roi['future_state'][method]['volume'])
-        
+        labels = result['volume_labels']
         x = np.arange(len(labels))
         width = 0.35
-        ax2.bar(x - width/2, current_vols, width, label='Current', color='coral')
-        ax2.bar(x + width/2, future_vols, width, label='Future', color='lightgreen')
+        ax2.bar(x - width/2, result['current_volumes'], width, label='Current', color='coral')
+        ax2.bar(x + width/2, result['future_volumes'], width, label='Future', color='lightgreen')
         ax2.set_title('PA Volume Distribution')
         ax2.set_ylabel('Annual Volume')
         ax2.set_xticks(x)
@@ -233,6 +336,8 @@ class PriorAuthROICalculator:
         ax2.legend()
         
         # 3. Savings timeline
+        weeks = result['weeks']
+        cumulative_savings = result['cumulative_savings']
         ax3.plot(weeks, cumulative_savings, 'g-', linewidth=2)
         ax3.fill_between(weeks, 0, cumulative_savings, alpha=0.3, color='green')
         ax3.set_title('Cumulative Savings Timeline')
@@ -241,13 +346,7 @@ class PriorAuthROICalculator:
         ax3.grid(True, alpha=0.3)
         
         # 4. ROI metrics
-        metrics = {
-            'Annual Savings': f"${automation_roi['annual_cost_savings']:,.0f}",
-            'Cost Reduction': f"{automation_roi['cost_reduction_percentage']:.1f}%",
-            'Break-even': f"{timeline_weeks/4:.1f} months",
-            'Year 1 ROI': f"{automation_roi['annual_cost_savings']/100000:.1f}x"
-        }
-        
+        metrics = result['metrics']
         y_pos = np.arange(len(metrics))
         ax4.barh(y_pos, [1]*len(metrics), alpha=0)
         for i, (metric, value) in enumerate(metrics.items()):
@@ -257,17 +356,29 @@ class PriorAuthROICalculator:
         ax4.axis('off')
         ax4.set_title('Key ROI Metrics')
         
-        plt.tight_layout()
+        if save_path:
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
+        
+        return fig
+    
+    def generate_roi_report(self, current_volumes, automation_targets, timeline_weeks=8):
+        """
+        Generate comprehensive ROI report with visualizations
+        """
+        result = self.compute_roi(current_volumes, automation_targets, timeline_weeks)
         
         return {
-            'automation_roi': automation_roi,
-            'figure': fig,
-            'metrics': metrics
+            'automation_roi': result['automation_roi'],
+            'figure': self.render_roi_report(result),
+            'metrics': result['metrics']
         }
 
 
 # Example usage
 if __name__ == "__main__":
+    # Batch run only saves the figure; use the non-interactive backend
+    matplotlib.use('Agg')
+    
     calculator = PriorAuthROICalculator()
     
     # Example current state (annual volumes)
@@ -295,8 +406,8 @@ if __name__ == "__main__":
         }
     }
     
-    # Generate report
-    report = calculator.generate_roi_report(current_volumes, automation_targets)
+    # Calculate ROI (no plotting)
+    report = calculator.compute_roi(current_volumes, automation_targets)
     
     # Print summary
     print("Prior Authorization ROI Analysis")
@@ -306,6 +417,6 @@ if __name__ == "__main__":
     print(f"Annual Savings: ${report['automation_roi']['annual_cost_savings']:,.0f}")
     print(f"Cost Reduction: {report['automation_roi']['cost_reduction_percentage']:.1f}%")
     
-    # Save visualization
-    report['figure'].savefig('pa_roi_analysis.png', dpi=300, bbox_inches='tight')
-    print("\nROI visualization saved as 'pa_roi_analysis.png'")
\ No newline at end of file
+    # Render and save visualization
+    calculator.render_roi_report(report, save_path='pa_roi_analysis.png')
+    print("\nROI visualization saved as 'pa_roi_analysis.png'")
@@ -6,15 +6,59 @@ Comprehensive analysis and visualization of hospital bed turnover metrics
 
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
+from datetime import datetime
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit, prange
+except ImportError:  # optional JIT for large sample generation
+    njit = None
+
 # Set style for professional visualizations
 plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+
+# int64 view of NaT in datetime64[ns] arrays, and ns -> minutes scale
+_NAT_NS = np.iinfo(np.int64).min
+_MINUTES_PER_NS = 1 / (60 * 10**9)
+_NS_PER_HOUR = 3600 * 10**9
+
+# Records per independently seeded block in the JIT sample generator
+_SAMPLE_CHUNK = 65536
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _fill_sample_arrays(n, unit_cdf, icu_idx, seed):
+        """Draw unit index and phase delays (minutes) for n turnover records"""
+        unit_idx = np.empty(n, dtype=np.int8)
+        evs_delay = np.empty(n)
+        cleaning_time = np.empty(n)
+        assignment_delay = np.empty(n)
+        
+        # Each block reseeds its thread's generator so results do not depend on scheduling
+        n_chunks = (n + _SAMPLE_CHUNK - 1) // _SAMPLE_CHUNK
+        for chunk in prange(n_chunks):
+            np.random.seed(seed + chunk)
+            for i in range(chunk * _SAMPLE_CHUNK, min(n, (chunk + 1) * _SAMPLE_CHUNK)):
+                r = np.random.random()
+                u = 0
+                while u < len(unit_cdf) - 1 and r >= unit_cdf[u]:
+                    u += 1
+                unit_idx[i] = u
+                
+                if u == icu_idx:
+                    evs_delay[i] = max(5.0, np.random.normal(45, 20))
+                    cleaning_time[i] = max(20.0, np.random.normal(75, 15))
+                    assignment_delay[i] = max(10.0, np.random.normal(60, 30))
+                else:
+                    evs_delay[i] = max(5.0, np.random.normal(30, 15))
+                    cleaning_time[i] = max(20.0, np.random.normal(45, 10))
+                    assignment_delay[i] = max(10.0, np.random.normal(45, 20))
+        
+        return unit_idx, evs_delay, cleaning_time, assignment_delay
 
 class BedTurnoverAnalyzer:
     """Analyze and visualize bed turnover performance metrics"""
@@ -22,6 +66,9 @@ class BedTurnoverAnalyzer:
     def __init__(self, turnover_data_path=None):
         """Initialize analyzer with optional data path"""
         self.turnover_data = None
+        self._timestamps_ns = None
+        self._figure = None
+        self._unit_summary = None
         self.bottleneck_summary = None
         self.financial_impact = None
         
@@ -36,9 +83,29 @@ class BedTurnoverAnalyzer:
         ])
         self._calculate_time_segments()
     
-    def generate_sample_data(self, n_records=1000):
-        """Generate realistic sample bed turnover data"""
-        np.random.seed(42)
+    def generate_sample_data(self, n_records=1000, use_numba=False, cache_dir=None):
+        """
+        Generate realistic sample bed turnover data
+        
+        use_numba: fill the delay arrays with a parallel JIT kernel (requires numba);
+        worthwhile for hundreds of thousands of records
+        cache_dir: reuse a parquet copy of the (deterministic) sample from this
+        directory, writing it on first use (requires pyarrow)
+        """
+        if use_numba and njit is None:
+            raise ImportError("use_numba=True requires the numba package")
+        
+        seed = 42
+        cache_path = None
+        if cache_dir is not None:
+            engine = 'numba' if use_numba else 'numpy'
+            cache_path = os.path.join(cache_dir, f'turnover_{n_records}_{seed}_{engine}.parquet')
+            if os.path.exists(cache_path):
+                self.turnover_data = pd.read_parquet(cache_path)
+                self._calculate_time_segments()
+                return self.turnover_data
+        
+        np.random.seed(seed)
         
         # Generate base timestamps
         base_dates = pd.date_range(start='2024-01-01', periods=n_records, freq='3H')
@@ -47,43 +114,48 @@ class BedTurnoverAnalyzer:
         units = ['ICU', 'Med/Surg A', 'Med/Surg B', 'Telemetry', 'Ortho', 'Cardiac', 'Neuro']
         unit_weights = [0.1, 0.25, 0.25, 0.15, 0.1, 0.1, 0.05]
         
-        data = []
-        for i, discharge_time in enumerate(base_dates):
-            unit = np.random.choice(units, p=unit_weights)
+        if use_numba:
+            unit_idx, evs_delay, cleaning_time, assignment_delay = _fill_sample_arrays(
+                n_records, np.cumsum(unit_weights), units.index('ICU'), seed
+            )
+        else:
+            unit_idx = np.random.choice(len(units), size=n_records, p=unit_weights).astype(np.int8)
+            is_icu = unit_idx == units.index('ICU')
             
-            # Realistic time distributions (in minutes)
-            if unit == 'ICU':
-                # ICU tends to have longer turnovers
-                evs_delay = np.random.normal(45, 20)
-                cleaning_time = np.random.normal(75, 15)
-                assignment_delay = np.random.normal(60, 30)
-            else:
-                # Standard units
-                evs_delay = np.random.normal(30, 15)
-                cleaning_time = np.random.normal(45, 10)
-                assignment_delay = np.random.normal(45, 20)
+            # Realistic time distributions (in minutes); ICU tends to have longer turnovers
+            evs_delay = np.where(is_icu, np.random.normal(45, 20, n_records), np.random.normal(30, 15, n_records))
+            cleaning_time = np.where(is_icu, np.random.normal(75, 15, n_records), np.random.normal(45, 10, n_records))
+            assignment_delay = np.where(is_icu, np.random.normal(60, 30, n_records), np.random.normal(45, 20, n_records))
             
             # Ensure positive values
-            evs_delay = max(5, evs_delay)
-            cleaning_time = max(20, cleaning_time)
-            assignment_delay = max(10, assignment_delay)
-            
-            # Calculate timestamps
-            evs_notified = discharge_time + timedelta(minutes=evs_delay)
-            cleaning_completed = evs_notified + timedelta(minutes=cleaning_time)
-            next_admission = cleaning_completed + timedelta(minutes=assignment_delay)
-            
-            data.append({
-                'bed_id': f'BED_{i%100:03d}',
-                'unit_name': unit,
-                'discharge_datetime': discharge_time,
-                'evs_notified_datetime': evs_notified,
-                'cleaning_completed_datetime': cleaning_completed,
-                'next_admission_datetime': next_admission,
-                'patient_type': np.random.choice(['Medical', 'Surgical', 'Emergency'])
-            })
-        
-        self.turnover_data = pd.DataFrame(data)
+            evs_delay = np.maximum(evs_delay, 5)
+            cleaning_time = np.maximum(cleaning_time, 20)
+            assignment_delay = np.maximum(assignment_delay, 10)
+        
+        # Calculate timestamps
+        evs_notified = base_dates + pd.to_timedelta(evs_delay, unit='m')
+        cleaning_completed = evs_notified + pd.to_timedelta(cleaning_time, unit='m')
+        next_admission = cleaning_completed + pd.to_timedelta(assignment_delay, unit='m')
+        
+        # Categorical labels: small integer codes instead of per-row Python strings
+        # (categories sorted so unit order matches the former string columns)
+        unit_order = np.argsort(units)
+        unit_rank = np.empty_like(unit_order)
+        unit_rank[unit_order] = np.arange(len(units))
+        bed_ids = [f'BED_{i:03d}' for i in range(100)]
+        
+        self.turnover_data = pd.DataFrame({
+            'bed_id': pd.Categorical.from_codes(np.arange(n_records) % 100, categories=bed_ids),
+            'unit_name': pd.Categorical.from_codes(unit_rank[unit_idx], categories=np.asarray(units)[unit_order]),
+            'discharge_datetime': base_dates,
+            'evs_notified_datetime': evs_notified,
+            'cleaning_completed_datetime': cleaning_completed,
+            'next_admission_datetime': next_admission,
+            'patient_type': np.random.choice(['Medical', 'Surgical', 'Emergency'], size=n_records)
+        })
+        if cache_path is not None:
+            self.turnover_data.to_parquet(cache_path, compression='zstd')
+        
         self._calculate_time_segments()
         return self.turnover_data
     
@@ -91,26 +163,37 @@ class BedTurnoverAnalyzer:
         """Calculate time segments for each turnover phase"""
         df = self.turnover_data
         
-        # Calculate time segments in minutes
-        df['discharge_to_evs_min'] = (
-            df['evs_notified_datetime'] - df['discharge_datetime']
-        ).dt.total_seconds() / 60
-        
-        df['evs_cleaning_min'] = (
-            df['cleaning_completed_datetime'] - df['evs_notified_datetime']
-        ).dt.total_seconds() / 60
+        # Cache timestamps once as int64 ns since epoch (NaT -> int64 min)
+        self._timestamps_ns = {
+            col: df[col].to_numpy(dtype='datetime64[ns]').view('i8')
+            for col in ['discharge_datetime', 'evs_notified_datetime',
+                        'cleaning_completed_datetime', 'next_admission_datetime']
+        }
         
-        df['clean_to_occupied_min'] = (
-            df['next_admission_datetime'] - df['cleaning_completed_datetime']
-        ).dt.total_seconds() / 60
+        # Calculate time segments in minutes
+        segments = {
+            'discharge_to_evs_min': self._minutes_between('discharge_datetime', 'evs_notified_datetime'),
+            'evs_cleaning_min': self._minutes_between('evs_notified_datetime', 'cleaning_completed_datetime'),
+            'clean_to_occupied_min': self._minutes_between('cleaning_completed_datetime', 'next_admission_datetime'),
+            'total_turnover_min': self._minutes_between('discharge_datetime', 'next_admission_datetime')
+        }
         
-        df['total_turnover_min'] = (
-            df['next_admission_datetime'] - df['discharge_datetime']
-        ).dt.total_seconds() / 60
+        # Attach as new columns on a new frame rather than writing into the loaded one
+        self.turnover_data = df.assign(**segments)
         
-        # Add hour of day for pattern analysis
-        df['discharge_hour'] = df['discharge_datetime'].dt.hour
-        df['discharge_dow'] = df['discharge_datetime'].dt.day_name()
+        # Per-unit phase means, shared by the breakdown chart and the heatmap
+        self._unit_summary = self.turnover_data.groupby('unit_name', observed=True, sort=False)[
+            ['discharge_to_evs_min', 'evs_cleaning_min', 'clean_to_occupied_min']
+        ].mean()
+    
+    def _minutes_between(self, start_col, end_col):
+        """Minutes from start_col to end_col using the cached int64 ns timestamps"""
+        start = self._timestamps_ns[start_col]
+        end = self._timestamps_ns[end_col]
+        
+        minutes = (end - start) * _MINUTES_PER_NS
+        minutes[(start == _NAT_NS) | (end == _NAT_NS)] = np.nan
+        return minutes
     
     def analyze_bottlenecks(self):
         """Identify and quantify bottlenecks in the turnover process"""
@@ -124,19 +207,24 @@ class BedTurnoverAnalyzer:
             'total_turnover_min': 90
         }
         
-        # Calculate excess time by phase
-        bottlenecks = {}
-        for phase, benchmark in benchmarks.items():
-            excess = df[phase] - benchmark
-            bottlenecks[phase] = {
-                'avg_actual': df[phase].mean(),
-                'benchmark': benchmark,
-                'avg_excess': excess[excess > 0].mean(),
-                'pct_over_benchmark': (excess > 0).sum() / len(df) * 100,
-                'total_excess_hours': excess[excess > 0].sum() / 60
-            }
-        
-        self.bottleneck_summary = pd.DataFrame(bottlenecks).T
+        # Calculate excess time for all phases in one 2D pass (rows x phases)
+        actual = df[list(benchmarks)].to_numpy(dtype=np.float64)
+        benchmark = np.array(list(benchmarks.values()), dtype=np.float64)
+        excess = actual - benchmark
+        over = excess > 0
+        
+        n_over = over.sum(axis=0)
+        total_excess = np.where(over, excess, 0).sum(axis=0)
+        avg_excess = np.full_like(total_excess, np.nan)
+        np.divide(total_excess, n_over, out=avg_excess, where=n_over > 0)
+        
+        self.bottleneck_summary = pd.DataFrame({
+            'avg_actual': np.nanmean(actual, axis=0),
+            'benchmark': benchmark,
+            'avg_excess': avg_excess,
+            'pct_over_benchmark': n_over / len(df) * 100,
+            'total_excess_hours': total_excess / 60
+        }, index=list(benchmarks))
         return self.bottleneck_summary
     
     def calculate_financial_impact(self, beds_count=300, revenue_per_bed_day=2000):
@@ -144,15 +232,17 @@ class BedTurnoverAnalyzer:
         df = self.turnover_data
         
         # Calculate excess time per turnover (vs 90 min benchmark)
-        excess_minutes = df['total_turnover_min'] - 90
-        excess_minutes = excess_minutes[excess_minutes > 0]
+        excess = df['total_turnover_min'].to_numpy(dtype=np.float64) - 90
+        over = excess > 0
+        n_over = int(over.sum())
+        excess_sum = np.where(over, excess, 0).sum()
         
         # Monthly and annual projections
         monthly_turnovers = len(df)
         annual_turnovers = monthly_turnovers * 12
         
         # Lost bed capacity
-        total_excess_hours_monthly = excess_minutes.sum() / 60
+        total_excess_hours_monthly = excess_sum / 60
         total_excess_hours_annual = total_excess_hours_monthly * 12
         lost_bed_days_annual = total_excess_hours_annual / 24
         
@@ -166,7 +256,7 @@ class BedTurnoverAnalyzer:
             'monthly_turnovers': monthly_turnovers,
             'annual_turnovers': annual_turnovers,
             'avg_turnover_time_min': df['total_turnover_min'].mean(),
-            'avg_excess_min': excess_minutes.mean() if len(excess_minutes) > 0 else 0,
+            'avg_excess_min': excess_sum / n_over if n_over else 0,
             'total_excess_hours_annual': total_excess_hours_annual,
             'lost_bed_days_annual': lost_bed_days_annual,
             'revenue_loss_annual': revenue_loss_annual,
@@ -176,17 +266,25 @@ class BedTurnoverAnalyzer:
         
         return self.financial_impact
     
+    def _reset_figure(self, figsize):
+        """Reuse one pyplot figure across visualizations instead of opening a new one per chart"""
+        if self._figure is None or not plt.fignum_exists(self._figure.number):
+            # Constrained layout is resolved at draw time and survives clf()
+            self._figure = plt.figure(figsize=figsize, constrained_layout=True)
+        else:
+            self._figure.clf()
+            self._figure.set_size_inches(figsize)
+            plt.figure(self._figure.number)  # make it current for pyplot-level calls
+        return self._figure
+    
     def visualize_turnover_breakdown(self, save_path=None):
         """Create stacked bar chart of turnover time components by unit"""
-        df = self.turnover_data
-        
-        # Aggregate by unit
-        unit_summary = df.groupby('unit_name')[
-            ['discharge_to_evs_min', 'evs_cleaning_min', 'clean_to_occupied_min']
-        ].mean().round(1)
+        # Aggregate by unit (cached per-unit means, in unit order)
+        unit_summary = self._unit_summary.sort_index().round(1)
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig = self._reset_figure((12, 8))
+        ax = fig.add_subplot()
         
         # Create stacked bar chart
         unit_summary.plot(kind='bar', stacked=True, ax=ax, 
@@ -210,8 +308,6 @@ class BedTurnoverAnalyzer:
         for container in ax.containers[:3]:
             ax.bar_label(container, label_type='center', fmt='%.0f')
         
-        plt.tight_layout()
-        
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight')
         else:
@@ -221,24 +317,37 @@ class BedTurnoverAnalyzer:
         """Visualize discharge patterns by hour of day"""
         df = self.turnover_data
         
-        # Create hourly summary
-        hourly = df.groupby('discharge_hour').agg({
-            'bed_id': 'count',
-            'total_turnover_min': 'mean'
-        }).rename(columns={'bed_id': 'discharge_count'})
+        # Mean turnover per hour via bincount (hours are bounded 0-23)
+        # Hour of day derived here on demand, from the cached ns timestamps for naive datetimes
+        discharge_ns = self._timestamps_ns['discharge_datetime']
+        has_hour = discharge_ns != _NAT_NS
+        if df['discharge_datetime'].dt.tz is None:
+            hours = (discharge_ns // _NS_PER_HOUR) % 24
+        else:
+            hours = df['discharge_datetime'].dt.hour.fillna(0).to_numpy(dtype=np.intp)
+        turnover = df['total_turnover_min'].to_numpy(dtype=np.float64)
+        valid = has_hour & ~np.isnan(turnover)
+        
+        hour_axis = np.arange(24)
+        turnover_sum = np.bincount(hours[valid], weights=turnover[valid], minlength=24)
+        turnover_n = np.bincount(hours[valid], minlength=24)
+        avg_turnover = np.full(24, np.nan)
+        np.divide(turnover_sum, turnover_n, out=avg_turnover, where=turnover_n > 0)
         
         # Create figure with two y-axes
-        fig, ax1 = plt.subplots(figsize=(12, 6))
+        fig = self._reset_figure((12, 6))
+        ax1 = fig.add_subplot()
         
         # Bar chart for discharge count
-        ax1.bar(hourly.index, hourly['discharge_count'], alpha=0.7, color='#4ECDC4')
+        ax1.hist(hours[has_hour], bins=np.arange(25) - 0.5, rwidth=0.8, alpha=0.7, color='#4ECDC4')
         ax1.set_xlabel('Hour of Day', fontsize=12)
         ax1.set_ylabel('Number of Discharges', fontsize=12, color='#4ECDC4')
         ax1.tick_params(axis='y', labelcolor='#4ECDC4')
         
         # Line chart for average turnover time
         ax2 = ax1.twinx()
-        ax2.plot(hourly.index, hourly['total_turnover_min'], 
+        observed = turnover_n > 0  # connect only hours that had discharges
+        ax2.plot(hour_axis[observed], avg_turnover[observed], 
                 color='#FF6B6B', marker='o', linewidth=2, markersize=8)
         ax2.set_ylabel('Average Turnover Time (min)', fontsize=12, color='#FF6B6B')
         ax2.tick_params(axis='y', labelcolor='#FF6B6B')
@@ -249,8 +358,6 @@ class BedTurnoverAnalyzer:
         ax1.set_xticks(range(24))
         ax1.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
-        
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight')
         else:
@@ -258,30 +365,18 @@ class BedTurnoverAnalyzer:
     
     def visualize_bottleneck_heatmap(self, save_path=None):
         """Create heatmap showing bottleneck severity by unit and phase"""
-        df = self.turnover_data
-        
         # Calculate excess time by unit and phase
-        phases = ['discharge_to_evs_min', 'evs_cleaning_min', 'clean_to_occupied_min']
-        benchmarks = [15, 45, 30]
-        
-        heatmap_data = []
-        for unit in df['unit_name'].unique():
-            unit_data = df[df['unit_name'] == unit]
-            row = []
-            for phase, benchmark in zip(phases, benchmarks):
-                excess_pct = ((unit_data[phase] - benchmark) / benchmark * 100).mean()
-                row.append(max(0, excess_pct))  # Only show delays, not improvements
-            heatmap_data.append(row)
-        
-        # Create DataFrame for heatmap
-        heatmap_df = pd.DataFrame(
-            heatmap_data,
-            index=df['unit_name'].unique(),
-            columns=['Discharge→EVS', 'EVS Cleaning', 'Clean→Occupied']
-        )
-        
-        # Create heatmap
-        plt.figure(figsize=(10, 8))
+        benchmarks = np.array([15, 45, 30])
+        
+        # Mean of per-row % excess equals % excess of the unit mean, so reuse the cached unit means
+        unit_means = self._unit_summary
+        heatmap_df = ((unit_means - benchmarks) / benchmarks * 100).clip(lower=0)  # Only show delays, not improvements
+        heatmap_df.columns = ['Discharge→EVS', 'EVS Cleaning', 'Clean→Occupied']
+        heatmap_df.index.name = None
+        
+        # Create heatmap (seaborn is only needed here, so import it on first use)
+        import seaborn as sns
+        self._reset_figure((10, 8))
         sns.heatmap(heatmap_df, annot=True, fmt='.0f', cmap='YlOrRd', 
                    cbar_kws={'label': '% Over Benchmark'})
         
@@ -289,8 +384,6 @@ class BedTurnoverAnalyzer:
                  fontsize=16, pad=20)
         plt.xlabel('Turnover Phase', fontsize=12)
         plt.ylabel('Unit', fontsize=12)
-        plt.tight_layout()
-        
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight')
         else:
@@ -338,6 +431,9 @@ IMPROVEMENT OPPORTUNITY
 
 # Example usage
 if __name__ == "__main__":
+    # Batch run saves every chart; use the non-interactive backend
+    matplotlib.use('Agg')
+    
     # Initialize analyzer
     analyzer = BedTurnoverAnalyzer()
     
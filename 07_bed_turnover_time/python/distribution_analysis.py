@@ -4,244 +4,461 @@ Distribution Analysis for Bed Turnover ROI Calculator
 Analyze which distributions are causing excessive variance in Monte Carlo simulation
 """
 
+import sys
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
 from scipy import stats
+from scipy.stats import qmc
 
-def analyze_distributions(n_samples=10000):
-    """Analyze the individual distributions used in the Monte Carlo simulation"""
-    np.random.seed(42)
-    
-    print("DISTRIBUTION ANALYSIS - BED TURNOVER ROI")
-    print("=" * 50)
-    
-    # Generate samples from each distribution
-    samples = {}
-    
-    # 1. Occupancy rate - Beta(7.5, 2.5)
-    occupancy = np.random.beta(7.5, 2.5, n_samples)
-    samples['occupancy'] = occupancy
-    print(f"\n1. OCCUPANCY RATE - Beta(7.5, 2.5)")
-    print(f"   Mean: {np.mean(occupancy):.3f}")
-    print(f"   Std:  {np.std(occupancy):.3f}")
-    print(f"   95% CI: {np.percentile(occupancy, 2.5):.3f} - {np.percentile(occupancy, 97.5):.3f}")
-    print(f"   Range: {np.min(occupancy):.3f} - {np.max(occupancy):.3f}")
-    print(f"   Coefficient of Variation: {np.std(occupancy)/np.mean(occupancy):.3f}")
-    
-    # 2. Current turnover time - Normal(180, 30)
-    current_turnover = np.random.normal(180, 30, n_samples)
-    current_turnover = np.maximum(120, current_turnover)  # Floor at 2 hours
-    samples['current_turnover'] = current_turnover
-    print(f"\n2. CURRENT TURNOVER TIME - Normal(180, 30), floored at 120")
-    print(f"   Mean: {np.mean(current_turnover):.1f} minutes")
-    print(f"   Std:  {np.std(current_turnover):.1f} minutes")
-    print(f"   95% CI: {np.percentile(current_turnover, 2.5):.1f} - {np.percentile(current_turnover, 97.5):.1f} minutes")
-    print(f"   Range: {np.min(current_turnover):.1f} - {np.max(current_turnover):.1f} minutes")
-    print(f"   Coefficient of Variation: {np.std(current_turnover)/np.mean(current_turnover):.3f}")
-    
-    # 3. Target turnover time - Normal(90, 15)
-    target_turnover = np.random.normal(90, 15, n_samples)
-    target_turnover = np.clip(target_turnover, 60, 120)  # Bound 60-120
-    samples['target_turnover'] = target_turnover
-    print(f"\n3. TARGET TURNOVER TIME - Normal(90, 15), bounded 60-120")
-    print(f"   Mean: {np.mean(target_turnover):.1f} minutes")
-    print(f"   Std:  {np.std(target_turnover):.1f} minutes")
-    print(f"   95% CI: {np.percentile(target_turnover, 2.5):.1f} - {np.percentile(target_turnover, 97.5):.1f} minutes")
-    print(f"   Range: {np.min(target_turnover):.1f} - {np.max(target_turnover):.1f} minutes")
-    print(f"   Coefficient of Variation: {np.std(target_turnover)/np.mean(target_turnover):.3f}")
-    
-    # 4. Revenue per bed day - Lognormal
-    revenue_per_bed = np.random.lognormal(np.log(2000), 0.2, n_samples)
-    samples['revenue_per_bed'] = revenue_per_bed
-    print(f"\n4. REVENUE PER BED DAY - Lognormal(ln(2000), 0.2)")
-    print(f"   Mean: ${np.mean(revenue_per_bed):.0f}")
-    print(f"   Std:  ${np.std(revenue_per_bed):.0f}")
-    print(f"   95% CI: ${np.percentile(revenue_per_bed, 2.5):.0f} - ${np.percentile(revenue_per_bed, 97.5):.0f}")
-    print(f"   Range: ${np.min(revenue_per_bed):.0f} - ${np.max(revenue_per_bed):.0f}")
-    print(f"   Coefficient of Variation: {np.std(revenue_per_bed)/np.mean(revenue_per_bed):.3f}")
-    
-    # 5. Implementation cost - Triangular(200k, 350k, 500k)
-    impl_cost = np.random.triangular(200000, 350000, 500000, n_samples)
-    samples['impl_cost'] = impl_cost
-    print(f"\n5. IMPLEMENTATION COST - Triangular(200k, 350k, 500k)")
-    print(f"   Mean: ${np.mean(impl_cost):.0f}")
-    print(f"   Std:  ${np.std(impl_cost):.0f}")
-    print(f"   95% CI: ${np.percentile(impl_cost, 2.5):.0f} - ${np.percentile(impl_cost, 97.5):.0f}")
-    print(f"   Range: ${np.min(impl_cost):.0f} - ${np.max(impl_cost):.0f}")
-    print(f"   Coefficient of Variation: {np.std(impl_cost)/np.mean(impl_cost):.3f}")
-    
-    # 6. Margin - Beta(4, 6) 
-    margin = np.random.beta(4, 6, n_samples)
-    samples['margin'] = margin
-    print(f"\n6. PROFIT MARGIN - Beta(4, 6)")
-    print(f"   Mean: {np.mean(margin):.3f}")
-    print(f"   Std:  {np.std(margin):.3f}")
-    print(f"   95% CI: {np.percentile(margin, 2.5):.3f} - {np.percentile(margin, 97.5):.3f}")
-    print(f"   Range: {np.min(margin):.3f} - {np.max(margin):.3f}")
-    print(f"   Coefficient of Variation: {np.std(margin)/np.mean(margin):.3f}")
+try:
+    from numba import njit, prange
+except ImportError:  # optional JIT for the compound benefit chain
+    njit = None
+
+# Rows of the array returned by _compound_benefits
+_COMPOUND_STAGES = ('time_saved', 'operational_beds', 'annual_turnovers', 'annual_bed_days_gained',
+                    'direct_revenue_gross', 'direct_revenue', 'total_benefit')
+
+# Draws per independently seeded block in the JIT beta sampler
+_BETA_CHUNK = 65536
+
+# Minutes of turnover time -> bed days (one multiply instead of /60 then /24)
+_DAYS_PER_MINUTE = 1.0 / (60 * 24)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _compound_kernel(occupancy, current_turnover, target_turnover, revenue_per_bed, margin,
+                         bed_count, annual_discharges_per_bed, revenue_uplift, overtime_per_turnover, out):
+        """Fill every compound stage for each sample in one pass, without array temporaries"""
+        for i in prange(occupancy.shape[0]):
+            time_saved = current_turnover[i] - target_turnover[i]
+            operational_beds = bed_count * occupancy[i]
+            annual_turnovers = operational_beds * annual_discharges_per_bed
+            annual_bed_days_gained = annual_turnovers * time_saved * _DAYS_PER_MINUTE
+            direct_revenue_gross = annual_bed_days_gained * revenue_per_bed[i]
+            direct_revenue = direct_revenue_gross * margin[i]
+            
+            out[0, i] = time_saved
+            out[1, i] = operational_beds
+            out[2, i] = annual_turnovers
+            out[3, i] = annual_bed_days_gained
+            out[4, i] = direct_revenue_gross
+            out[5, i] = direct_revenue
+            out[6, i] = direct_revenue * revenue_uplift + annual_turnovers * overtime_per_turnover
+    
+    @njit(parallel=True, cache=True)
+    def _beta_kernel(a, b, seed, out):
+        """Fill out with Beta(a, b) draws in compiled code"""
+        # Each block reseeds its thread's generator so results do not depend on scheduling
+        n = out.shape[0]
+        n_chunks = (n + _BETA_CHUNK - 1) // _BETA_CHUNK
+        for chunk in prange(n_chunks):
+            np.random.seed(seed + chunk)
+            for i in range(chunk * _BETA_CHUNK, min(n, (chunk + 1) * _BETA_CHUNK)):
+                out[i] = np.random.beta(a, b)
+
+def _summarize(x):
+    """Min, max, mean, std and 95% CI bounds of x, all read from one sorted copy"""
+    s = np.sort(x)
+    n = s.size
+    
+    # Linear interpolation between order statistics, as np.percentile does by default
+    pos = np.array([0.025, 0.975]) * (n - 1)
+    lower = np.floor(pos).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    lo, hi = s[lower] + (s[upper] - s[lower]) * (pos - lower)
+    
+    # Moments over the sorted copy while it is still cache-hot, accumulated in float64
+    return s[0], s[-1], s.mean(dtype=np.float64), s.std(dtype=np.float64), lo, hi
+
+def _compound_benefits(occupancy, current_turnover, target_turnover, revenue_per_bed, margin,
+                       bed_count=300, annual_discharges_per_bed=91.25, use_numba=False):
+    """
+    Annual benefit chain per sample, one row per stage in _COMPOUND_STAGES
+    
+    use_numba: fuse the chain into a single parallel JIT pass (requires numba)
+    """
+    if use_numba and njit is None:
+        raise ImportError("use_numba=True requires the numba package")
+    
+    # Other benefits (keep these as reasonable constants)
+    ed_benefit_pct = 0.10  # Fixed 10%
+    surgery_benefit_pct = 0.05  # Fixed 5%
+    overtime_benefit_pct = 0.15  # Fixed 15%
+    revenue_uplift = 1 + ed_benefit_pct + surgery_benefit_pct
+    overtime_per_turnover = 0.5 * 75 * overtime_benefit_pct
+    
+    # Stages keep the precision of the sample arrays (float32 by default)
+    n = len(occupancy)
+    dtype = np.result_type(occupancy, current_turnover, revenue_per_bed, margin)
+    out = np.empty((len(_COMPOUND_STAGES), n), dtype=dtype)
+    target_turnover = np.broadcast_to(np.asarray(target_turnover, dtype=dtype), (n,))
+    
+    if use_numba:
+        _compound_kernel(occupancy, current_turnover, target_turnover, revenue_per_bed, margin,
+                         bed_count, annual_discharges_per_bed, revenue_uplift, overtime_per_turnover, out)
+        return out
+    
+    # Same chain in NumPy, writing each stage straight into its output row
+    time_saved, operational_beds, annual_turnovers, bed_days, gross, net, total = out
+    np.subtract(current_turnover, target_turnover, out=time_saved)
+    np.multiply(occupancy, bed_count, out=operational_beds)
+    np.multiply(operational_beds, annual_discharges_per_bed, out=annual_turnovers)
+    np.multiply(annual_turnovers, time_saved, out=bed_days)
+    bed_days *= _DAYS_PER_MINUTE
+    np.multiply(bed_days, revenue_per_bed, out=gross)
+    np.multiply(gross, margin, out=net)
+    np.multiply(net, revenue_uplift, out=total)
+    total += annual_turnovers * overtime_per_turnover
+    return out
+
+def _draw_beta(rng, a, b, out, use_numba=False):
+    """Fill out with Beta(a, b) draws, from the JIT kernel (seeded off rng) when use_numba"""
+    if use_numba:
+        _beta_kernel(a, b, int(rng.integers(2**31)), out)
+    else:
+        out[:] = rng.beta(a, b, out.shape[0])
+
+def _antithetic_uniforms(rng, n_dims, n_samples):
+    """
+    U(0,1) draws of shape (n_dims, n_samples) made of antithetic pairs u, 1-u
+    
+    Samples are no longer i.i.d., but means and CVs stay unbiased and have lower
+    variance for monotone transforms of the inputs, which every stage here is
+    """
+    u = rng.random((n_dims, (n_samples + 1) // 2))
+    return np.concatenate([u, 1.0 - u], axis=1)[:, :n_samples]
+
+def _sobol_uniforms(rng, n_dims, n_samples):
+    """
+    Scrambled Sobol points of shape (n_dims, n_samples)
+    
+    Low-discrepancy points fill the unit cube evenly, so means, stds and
+    percentiles converge close to O(1/n) rather than O(1/sqrt(n)); a power of
+    two n_samples keeps the sequence balanced
+    """
+    sampler = qmc.Sobol(n_dims, scramble=True, seed=rng)
+    if n_samples & (n_samples - 1) == 0:
+        return sampler.random_base2(int(np.log2(n_samples))).T
+    return sampler.random(n_samples).T
+
+def _copula_uniforms(rng, keys, n_samples, correlation, sampling='random'):
+    """
+    Correlated U(0,1) draws, one row per input in keys, via a Gaussian copula
+    
+    correlation maps (key, key) pairs to latent-normal correlations; unlisted pairs
+    stay independent. Antithetic pairs are formed in normal space as z, -z, and
+    Sobol points are mapped to normals before the correlation is applied.
+    """
+    index = {key: i for i, key in enumerate(keys)}
+    corr = np.eye(len(keys))
+    for (a, b), rho in correlation.items():
+        for key in (a, b):
+            if key not in index:
+                raise ValueError(f"correlation key {key!r} in pair {(a, b)!r} is not a sampled input; "
+                                 f"expected one of {', '.join(map(repr, keys))}")
+        if a == b:
+            raise ValueError(f"correlation pair {(a, b)!r} must name two different inputs")
+        if not -1 <= rho <= 1:
+            raise ValueError(f"correlation for {(a, b)!r} must lie in [-1, 1], got {rho!r}")
+        corr[index[a], index[b]] = corr[index[b], index[a]] = rho
+    try:
+        chol = np.linalg.cholesky(corr)
+    except np.linalg.LinAlgError:
+        raise ValueError("correlation matrix must be positive definite") from None
+    
+    if sampling == 'antithetic':
+        z = rng.standard_normal((len(keys), (n_samples + 1) // 2))
+        z = np.concatenate([z, -z], axis=1)[:, :n_samples]
+    elif sampling == 'sobol':
+        z = stats.norm.ppf(_sobol_uniforms(rng, len(keys), n_samples))
+    else:
+        z = rng.standard_normal((len(keys), n_samples))
+    return stats.norm.cdf(chol @ z)
+
+def _inversion_uniforms(rng, keys, n_samples, sampling, correlation=None):
+    """U(0,1) inputs, one row per key, for inverting through each marginal's quantile function"""
+    if correlation is not None:
+        return _copula_uniforms(rng, keys, n_samples, correlation, sampling)
+    if sampling == 'sobol':
+        return _sobol_uniforms(rng, len(keys), n_samples)
+    return _antithetic_uniforms(rng, len(keys), n_samples)
+
+def _check_sampling(sampling):
+    """Reject unknown sampling schemes before any draws are made"""
+    if sampling not in ('random', 'antithetic', 'sobol'):
+        raise ValueError(f"sampling must be 'random', 'antithetic' or 'sobol', got {sampling!r}")
+
+def _beta(a, b):
+    """(draw, ppf) pair for a Beta(a, b) input"""
+    def draw(rng, out, use_numba):
+        _draw_beta(rng, a, b, out, use_numba)
+    return draw, lambda u: stats.beta.ppf(u, a, b)
+
+def _normal(loc, scale):
+    """(draw, ppf) pair for a Normal(loc, scale) input"""
+    def draw(rng, out, use_numba):
+        out[:] = rng.normal(loc, scale, out.shape[0])
+    return draw, lambda u: stats.norm.ppf(u, loc, scale)
+
+def _lognormal(mean, sigma):
+    """(draw, ppf) pair for a Lognormal(mean, sigma) input"""
+    def draw(rng, out, use_numba):
+        out[:] = rng.lognormal(mean, sigma, out.shape[0])
+    return draw, lambda u: np.exp(stats.norm.ppf(u, mean, sigma))
+
+def _triangular(left, mode, right):
+    """(draw, ppf) pair for a Triangular(left, mode, right) input"""
+    def draw(rng, out, use_numba):
+        out[:] = rng.triangular(left, mode, right, out.shape[0])
+    return draw, lambda u: stats.triang.ppf(u, (mode - left) / (right - left), left, right - left)
+
+# Report lines per input, formatted with the _summarize stats
+_FULL_REPORT = (
+    "   Mean: {pre}{mu:{fmt}}{unit}",
+    "   Std:  {pre}{sd:{fmt}}{unit}",
+    "   95% CI: {pre}{lo:{fmt}} - {pre}{hi:{fmt}}{unit}",
+    "   Range: {pre}{mn:{fmt}} - {pre}{mx:{fmt}}{unit}",
+    "   Coefficient of Variation: {cv:.3f}"
+)
+_BRIEF_REPORT = (
+    "   Mean: {pre}{mu:{fmt}}{unit}",
+    "   95% CI: {pre}{lo:{fmt}} - {pre}{hi:{fmt}}",
+    "   CV: {cv:.3f}"
+)
+
+@dataclass(frozen=True)
+class DistSpec:
+    """One model input: how it is sampled and how it is reported"""
+    key: str
+    title: str
+    draw: Optional[Callable] = None  # draw(rng, out, use_numba) fills out with i.i.d. samples
+    ppf: Optional[Callable] = None  # quantile function, for inversion sampling
+    bounds: Tuple = (None, None)  # floor / ceiling applied after sampling
+    value_format: Tuple = ('', '.3f', '')  # prefix, format spec, unit
+    report: Tuple = _FULL_REPORT
+    fixed: Optional[float] = None  # constant input, not sampled
+
+CURRENT_SPECS = (
+    DistSpec('occupancy', "OCCUPANCY RATE - Beta(7.5, 2.5)", *_beta(7.5, 2.5)),
+    DistSpec('current_turnover', "CURRENT TURNOVER TIME - Normal(180, 30), floored at 120",
+             *_normal(180, 30), bounds=(120, None), value_format=('', '.1f', ' minutes')),  # Floor at 2 hours
+    DistSpec('target_turnover', "TARGET TURNOVER TIME - Normal(90, 15), bounded 60-120",
+             *_normal(90, 15), bounds=(60, 120), value_format=('', '.1f', ' minutes')),
+    DistSpec('revenue_per_bed', "REVENUE PER BED DAY - Lognormal(ln(2000), 0.2)",
+             *_lognormal(np.log(2000), 0.2), value_format=('$', '.0f', '')),
+    DistSpec('impl_cost', "IMPLEMENTATION COST - Triangular(200k, 350k, 500k)",
+             *_triangular(200000, 350000, 500000), value_format=('$', '.0f', '')),
+    DistSpec('margin', "PROFIT MARGIN - Beta(4, 6)", *_beta(4, 6))
+)
+
+REALISTIC_SPECS = (
+    # Occupancy - Much tighter, hospitals know their occupancy well
+    # Beta(30, 10) gives mean 0.75 with much tighter range
+    DistSpec('occupancy', "OCCUPANCY RATE - Beta(30, 10) [TIGHTER]", *_beta(30, 10),
+             report=_BRIEF_REPORT[:1] + ("   Std:  {pre}{sd:{fmt}}{unit}",) + _BRIEF_REPORT[1:]),
+    # Current turnover - Much smaller variation (half the std)
+    DistSpec('current_turnover', "CURRENT TURNOVER - Normal(180, 15) [TIGHTER]", *_normal(180, 15),
+             bounds=(150, None), value_format=('', '.1f', ' minutes'), report=_BRIEF_REPORT),
+    # Target turnover - Fixed (hospitals control this), broadcast as a scalar
+    DistSpec('target_turnover', "TARGET TURNOVER - Fixed at 90 minutes [NO VARIATION]", fixed=90.0),
+    # Revenue - Truncated normal instead of lognormal
+    DistSpec('revenue_per_bed', "REVENUE PER BED - Normal(2000, 200), clipped [MUCH TIGHTER]",
+             *_normal(2000, 200), bounds=(1500, 2500), value_format=('$', '.0f', ''), report=_BRIEF_REPORT),
+    # Implementation cost - Tighter triangular
+    DistSpec('impl_cost', "IMPLEMENTATION COST - Triangular(300k, 350k, 400k) [TIGHTER]",
+             *_triangular(300000, 350000, 400000), value_format=('$', '.0f', ''), report=_BRIEF_REPORT),
+    # Margin - Tighter beta, mean 0.4
+    DistSpec('margin', "PROFIT MARGIN - Beta(8, 12) [TIGHTER]", *_beta(8, 12), report=_BRIEF_REPORT)
+)
+
+def _run_specs(lines, specs, n_samples, use_numba, sampling, dtype, correlation):
+    """
+    Sample every input in specs and append its report block to lines
+    
+    Returns the samples keyed by spec key (fixed inputs as scalars), per-key CVs,
+    and the compound benefit stages (see _compound_benefits)
+    """
+    _check_sampling(sampling)
+    if use_numba and njit is None:
+        raise ImportError("use_numba=True requires the numba package")
+    rng = np.random.default_rng(42)
+    
+    # Generate samples from each distribution into the rows of one contiguous buffer
+    sampled = [spec for spec in specs if spec.fixed is None]
+    buf = np.empty((len(sampled), n_samples), dtype=dtype)
+    if correlation is not None or sampling != 'random':
+        u = _inversion_uniforms(rng, tuple(spec.key for spec in sampled), n_samples, sampling, correlation)
+        for row, spec, u_row in zip(buf, sampled, u):
+            row[:] = spec.ppf(u_row)
+    else:
+        for row, spec in zip(buf, sampled):
+            spec.draw(rng, row, use_numba)
+    for row, spec in zip(buf, sampled):
+        if spec.bounds != (None, None):
+            np.clip(row, *spec.bounds, out=row)
+    
+    rows = dict(zip((spec.key for spec in sampled), buf))
+    samples = {spec.key: rows.get(spec.key, spec.fixed) for spec in specs}
+    
+    cvs = {}
+    for i, spec in enumerate(specs, 1):
+        lines.append(f"\n{i}. {spec.title}")
+        if spec.fixed is not None:
+            continue
+        mn, mx, mu, sd, lo, hi = _summarize(samples[spec.key])
+        cvs[spec.key] = sd / mu
+        pre, fmt, unit = spec.value_format
+        for line in spec.report:
+            lines.append(line.format(pre=pre, fmt=fmt, unit=unit, mn=mn, mx=mx, mu=mu, sd=sd, lo=lo, hi=hi, cv=sd / mu))
+    
+    stages = _compound_benefits(
+        samples['occupancy'], samples['current_turnover'], samples['target_turnover'],
+        samples['revenue_per_bed'], samples['margin'], use_numba=use_numba
+    )
+    return samples, cvs, stages
+
+def analyze_distributions(n_samples=10000, use_numba=False, sampling='random', dtype=np.float32,
+                          correlation=None):
+    """
+    Analyze the individual distributions used in the Monte Carlo simulation
+    
+    use_numba: draw the beta inputs and compute the compound benefit chain with
+    JIT kernels (requires numba)
+    sampling: 'random' for i.i.d. draws, 'antithetic' to invert paired uniforms
+    through each marginal (similar CV precision from roughly half the n_samples),
+    or 'sobol' to invert scrambled quasi-random points (use a power of two
+    n_samples, e.g. 8192)
+    dtype: storage for the sample arrays; float32 halves the bytes every
+    reduction reads and is ample for the printed precision
+    correlation: optional {(key, key): rho} between inputs (keys as in the
+    returned samples), e.g. {('occupancy', 'revenue_per_bed'): 0.3}; draws
+    them jointly through a Gaussian copula and inverts each marginal
+    """
+    text, samples = _current_report(n_samples, use_numba, sampling, dtype, correlation)
+    sys.stdout.write(text)
+    return samples
+
+def _current_report(n_samples, use_numba, sampling, dtype, correlation):
+    """Report text and samples for analyze_distributions, without writing to stdout"""
+    lines = []  # report is returned as one string for the caller to write
+    lines.append("DISTRIBUTION ANALYSIS - BED TURNOVER ROI")
+    lines.append("=" * 50)
+    
+    samples, cvs, stages = _run_specs(lines, CURRENT_SPECS, n_samples, use_numba, sampling, dtype, correlation)
     
     # Calculate compound effect on annual benefit
-    print(f"\n" + "="*50)
-    print("COMPOUND VARIANCE ANALYSIS")
-    print("="*50)
+    lines.append(f"\n" + "="*50)
+    lines.append("COMPOUND VARIANCE ANALYSIS")
+    lines.append("="*50)
     
     # Simulate the key calculation components
-    bed_count = 300
-    annual_discharges_per_bed = 91.25
+    (time_saved, operational_beds, annual_turnovers, annual_bed_days_gained,
+     direct_revenue_gross, direct_revenue, _) = stages
     
     # Time savings component
-    time_saved = current_turnover - target_turnover
     time_saved_cv = np.std(time_saved) / np.mean(time_saved)
-    print(f"Time Saved CV: {time_saved_cv:.3f}")
+    lines.append(f"Time Saved CV: {time_saved_cv:.3f}")
     
     # Operational beds
-    operational_beds = bed_count * occupancy
     operational_beds_cv = np.std(operational_beds) / np.mean(operational_beds)
-    print(f"Operational Beds CV: {operational_beds_cv:.3f}")
+    lines.append(f"Operational Beds CV: {operational_beds_cv:.3f}")
     
     # Annual turnovers
-    annual_turnovers = operational_beds * annual_discharges_per_bed
     annual_turnovers_cv = np.std(annual_turnovers) / np.mean(annual_turnovers)
-    print(f"Annual Turnovers CV: {annual_turnovers_cv:.3f}")
+    lines.append(f"Annual Turnovers CV: {annual_turnovers_cv:.3f}")
     
     # Bed days gained
-    annual_hours_saved = (annual_turnovers * time_saved) / 60
-    annual_bed_days_gained = annual_hours_saved / 24
     bed_days_cv = np.std(annual_bed_days_gained) / np.mean(annual_bed_days_gained)
-    print(f"Bed Days Gained CV: {bed_days_cv:.3f}")
+    lines.append(f"Bed Days Gained CV: {bed_days_cv:.3f}")
     
     # Direct revenue (before margin)
-    direct_revenue_gross = annual_bed_days_gained * revenue_per_bed
     direct_revenue_gross_cv = np.std(direct_revenue_gross) / np.mean(direct_revenue_gross)
-    print(f"Direct Revenue (gross) CV: {direct_revenue_gross_cv:.3f}")
+    lines.append(f"Direct Revenue (gross) CV: {direct_revenue_gross_cv:.3f}")
     
     # With margin applied
-    direct_revenue = direct_revenue_gross * margin
     direct_revenue_cv = np.std(direct_revenue) / np.mean(direct_revenue)
-    print(f"Direct Revenue (net) CV: {direct_revenue_cv:.3f}")
+    lines.append(f"Direct Revenue (net) CV: {direct_revenue_cv:.3f}")
     
     # Identify the biggest drivers
-    print(f"\nVARIANCE CONTRIBUTION RANKING:")
+    lines.append(f"\nVARIANCE CONTRIBUTION RANKING:")
     cv_components = {
         'Time Saved': time_saved_cv,
-        'Occupancy': np.std(occupancy)/np.mean(occupancy),
-        'Revenue per Bed': np.std(revenue_per_bed)/np.mean(revenue_per_bed),
-        'Margin': np.std(margin)/np.mean(margin),
-        'Implementation Cost': np.std(impl_cost)/np.mean(impl_cost)
+        'Occupancy': cvs['occupancy'],
+        'Revenue per Bed': cvs['revenue_per_bed'],
+        'Margin': cvs['margin'],
+        'Implementation Cost': cvs['impl_cost']
     }
     
     for name, cv in sorted(cv_components.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {name}: {cv:.3f}")
+        lines.append(f"  {name}: {cv:.3f}")
     
-    return samples
+    return "\n".join(lines) + "\n", samples
 
-def realistic_distributions_analysis(n_samples=10000):
-    """Analyze more realistic, tighter distributions"""
-    np.random.seed(42)
-    
-    print(f"\n" + "="*50)
-    print("PROPOSED REALISTIC DISTRIBUTIONS")
-    print("="*50)
+def realistic_distributions_analysis(n_samples=10000, use_numba=False, sampling='random', dtype=np.float32,
+                                     correlation=None):
+    """
+    Analyze more realistic, tighter distributions
+    
+    use_numba: draw the beta inputs and compute the compound benefit chain with
+    JIT kernels (requires numba)
+    sampling, dtype, correlation: as in analyze_distributions (the fixed target
+    turnover cannot be correlated)
+    """
+    text, samples_realistic, total_benefit_real = _realistic_report(n_samples, use_numba, sampling, dtype,
+                                                                     correlation)
+    sys.stdout.write(text)
+    return samples_realistic, total_benefit_real
+
+def _realistic_report(n_samples, use_numba, sampling, dtype, correlation):
+    """Report text, samples and annual benefits for realistic_distributions_analysis"""
+    lines = []  # report is returned as one string for the caller to write
+    lines.append(f"\n" + "="*50)
+    lines.append("PROPOSED REALISTIC DISTRIBUTIONS")
+    lines.append("="*50)
     
     # More realistic distributions
-    samples_realistic = {}
-    
-    # 1. Occupancy - Much tighter, hospitals know their occupancy well
-    # Beta(30, 10) gives mean 0.75 with much tighter range
-    occupancy_real = np.random.beta(30, 10, n_samples)
-    samples_realistic['occupancy'] = occupancy_real
-    print(f"\n1. OCCUPANCY RATE - Beta(30, 10) [TIGHTER]")
-    print(f"   Mean: {np.mean(occupancy_real):.3f}")
-    print(f"   Std:  {np.std(occupancy_real):.3f}")
-    print(f"   95% CI: {np.percentile(occupancy_real, 2.5):.3f} - {np.percentile(occupancy_real, 97.5):.3f}")
-    print(f"   CV: {np.std(occupancy_real)/np.mean(occupancy_real):.3f}")
-    
-    # 2. Current turnover - Much smaller variation
-    current_turnover_real = np.random.normal(180, 15, n_samples)  # Half the std
-    current_turnover_real = np.maximum(150, current_turnover_real)
-    samples_realistic['current_turnover'] = current_turnover_real
-    print(f"\n2. CURRENT TURNOVER - Normal(180, 15) [TIGHTER]")
-    print(f"   Mean: {np.mean(current_turnover_real):.1f} minutes")
-    print(f"   95% CI: {np.percentile(current_turnover_real, 2.5):.1f} - {np.percentile(current_turnover_real, 97.5):.1f}")
-    print(f"   CV: {np.std(current_turnover_real)/np.mean(current_turnover_real):.3f}")
-    
-    # 3. Target turnover - Fixed (hospitals control this)
-    target_turnover_real = np.full(n_samples, 90)  # Fixed target
-    samples_realistic['target_turnover'] = target_turnover_real
-    print(f"\n3. TARGET TURNOVER - Fixed at 90 minutes [NO VARIATION]")
-    
-    # 4. Revenue - Truncated normal instead of lognormal
-    revenue_real = np.random.normal(2000, 200, n_samples)  # Much tighter
-    revenue_real = np.clip(revenue_real, 1500, 2500)
-    samples_realistic['revenue_per_bed'] = revenue_real
-    print(f"\n4. REVENUE PER BED - Normal(2000, 200), clipped [MUCH TIGHTER]")
-    print(f"   Mean: ${np.mean(revenue_real):.0f}")
-    print(f"   95% CI: ${np.percentile(revenue_real, 2.5):.0f} - ${np.percentile(revenue_real, 97.5):.0f}")
-    print(f"   CV: {np.std(revenue_real)/np.mean(revenue_real):.3f}")
-    
-    # 5. Implementation cost - Tighter triangular
-    impl_cost_real = np.random.triangular(300000, 350000, 400000, n_samples)
-    samples_realistic['impl_cost'] = impl_cost_real
-    print(f"\n5. IMPLEMENTATION COST - Triangular(300k, 350k, 400k) [TIGHTER]")
-    print(f"   Mean: ${np.mean(impl_cost_real):.0f}")
-    print(f"   95% CI: ${np.percentile(impl_cost_real, 2.5):.0f} - ${np.percentile(impl_cost_real, 97.5):.0f}")
-    print(f"   CV: {np.std(impl_cost_real)/np.mean(impl_cost_real):.3f}")
-    
-    # 6. Margin - Tighter beta
-    margin_real = np.random.beta(8, 12, n_samples)  # Mean 0.4, much tighter
-    samples_realistic['margin'] = margin_real
-    print(f"\n6. PROFIT MARGIN - Beta(8, 12) [TIGHTER]")
-    print(f"   Mean: {np.mean(margin_real):.3f}")
-    print(f"   95% CI: {np.percentile(margin_real, 2.5):.3f} - {np.percentile(margin_real, 97.5):.3f}")
-    print(f"   CV: {np.std(margin_real)/np.mean(margin_real):.3f}")
+    samples_realistic, _, stages = _run_specs(lines, REALISTIC_SPECS, n_samples, use_numba, sampling, dtype, correlation)
     
     # Calculate realistic annual benefit range
-    bed_count = 300
-    annual_discharges_per_bed = 91.25
+    total_benefit_real = stages[-1]
     
-    time_saved_real = current_turnover_real - target_turnover_real
-    operational_beds_real = bed_count * occupancy_real
-    annual_turnovers_real = operational_beds_real * annual_discharges_per_bed
-    annual_hours_saved_real = (annual_turnovers_real * time_saved_real) / 60
-    annual_bed_days_gained_real = annual_hours_saved_real / 24
-    direct_revenue_real = annual_bed_days_gained_real * revenue_real * margin_real
+    mn, mx, mu, sd, lo, hi = _summarize(total_benefit_real)
+    lines.append(f"\nREALISTIC ANNUAL BENEFIT DISTRIBUTION:")
+    lines.append(f"   Mean: ${mu:,.0f}")
+    lines.append(f"   Std:  ${sd:,.0f}")
+    lines.append(f"   95% CI: ${lo:,.0f} - ${hi:,.0f}")
+    lines.append(f"   CV: {sd/mu:.3f}")
+    lines.append(f"   Range Factor: {hi/lo:.1f}x")
     
-    # Add other benefits (keep these as reasonable constants)
-    ed_benefit_pct = 0.10  # Fixed 10%
-    surgery_benefit_pct = 0.05  # Fixed 5%
-    overtime_benefit_pct = 0.15  # Fixed 15%
-    
-    ed_savings_real = direct_revenue_real * ed_benefit_pct
-    surgery_savings_real = direct_revenue_real * surgery_benefit_pct
-    overtime_savings_real = annual_turnovers_real * 0.5 * 75 * overtime_benefit_pct
-    
-    total_benefit_real = direct_revenue_real + ed_savings_real + surgery_savings_real + overtime_savings_real
-    
-    print(f"\nREALISTIC ANNUAL BENEFIT DISTRIBUTION:")
-    print(f"   Mean: ${np.mean(total_benefit_real):,.0f}")
-    print(f"   Std:  ${np.std(total_benefit_real):,.0f}")
-    print(f"   95% CI: ${np.percentile(total_benefit_real, 2.5):,.0f} - ${np.percentile(total_benefit_real, 97.5):,.0f}")
-    print(f"   CV: {np.std(total_benefit_real)/np.mean(total_benefit_real):.3f}")
-    print(f"   Range Factor: {np.percentile(total_benefit_real, 97.5)/np.percentile(total_benefit_real, 2.5):.1f}x")
-    
-    return samples_realistic, total_benefit_real
+    return "\n".join(lines) + "\n", samples_realistic, total_benefit_real
 
 if __name__ == "__main__":
-    # Analyze current distributions
-    current_samples = analyze_distributions()
-    
-    # Analyze realistic distributions
-    realistic_samples, realistic_benefits = realistic_distributions_analysis()
-    
-    print(f"\n" + "="*50)
-    print("RECOMMENDATION SUMMARY")
-    print("="*50)
-    print("The excessive variance is caused by:")
-    print("1. Lognormal revenue distribution creates extreme outliers")
-    print("2. Wide occupancy variation (Beta(7.5, 2.5) = 60-85% range)")
-    print("3. Large turnover time standard deviations")
-    print("4. Profit margin variation adds multiplicative uncertainty")
-    print("5. All uncertainties compound multiplicatively")
-    print("\nRealistic assumptions should produce 2-3x range instead of 10x range.")
\ No newline at end of file
+    # The two analyses share no state, so run them side by side and print in order
+    defaults = (10000, False, 'random', np.float32, None)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        current = pool.submit(_current_report, *defaults)
+        realistic = pool.submit(_realistic_report, *defaults)
+        
+        # Analyze current distributions
+        current_text, current_samples = current.result()
+        sys.stdout.write(current_text)
+        
+        # Analyze realistic distributions
+        realistic_text, realistic_samples, realistic_benefits = realistic.result()
+        sys.stdout.write(realistic_text)
+    
+    sys.stdout.write("\n".join([
+        f"\n" + "="*50,
+        "RECOMMENDATION SUMMARY",
+        "="*50,
+        "The excessive variance is caused by:",
+        "1. Lognormal revenue distribution creates extreme outliers",
+        "2. Wide occupancy variation (Beta(7.5, 2.5) = 60-85% range)",
+        "3. Large turnover time standard deviations",
+        "4. Profit margin variation adds multiplicative uncertainty",
+        "5. All uncertainties compound multiplicatively",
+        "\nRealistic assumptions should produce 2-3x range instead of 10x range."
+    ]) + "\n")
\ No newline at end of file
@@ -2,12 +2,394 @@
 """
 Bed Turnover ROI Calculator
 Calculate the return on investment for bed turnover improvement initiatives
+
+Only NumPy is required; numba is optional and only used when use_numba=True
 """
 
-import pandas as pd
+import math
 import numpy as np
-from datetime import datetime
-from scipy import stats
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+try:
+    from numba import float32, float64, guvectorize, njit, prange
+except ImportError:  # optional JIT for the Monte Carlo simulation
+    njit = None
+
+# Iterations per independently seeded block in the JIT Monte Carlo kernel
+_MC_CHUNK = 4096
+
+if njit is not None:
+    @njit(cache=True)
+    def _mc_iteration(occupancy, current_turnover, revenue_per_bed, impl_cost, maint_cost, margin,
+                      discount_rate, turnovers_per_occupancy, overtime_per_turnover, training_cost):
+        """(annual benefit, ROI %, NPV, payback months) of one iteration, same model as _simulate"""
+        time_saved = current_turnover - 90
+        if time_saved <= 0:
+            return 0.0, -100.0, -impl_cost, np.inf
+        
+        annual_turnovers = occupancy * turnovers_per_occupancy
+        direct_revenue = annual_turnovers * time_saved / 60 / 24 * revenue_per_bed * margin
+        total_benefit = direct_revenue * (1 + 0.10 + 0.05) + annual_turnovers * overtime_per_turnover
+        year1_cost = impl_cost + training_cost
+        
+        npv = total_benefit - year1_cost
+        for year in range(1, 5):
+            npv += (total_benefit - maint_cost) / (1 + discount_rate) ** year
+        
+        total_investment = year1_cost + maint_cost * 4
+        roi = (total_benefit * 5 - total_investment) / total_investment * 100
+        
+        payback_months = np.inf
+        later_monthly = (total_benefit - maint_cost) / 12
+        if total_benefit <= 0:
+            pass
+        elif total_benefit > year1_cost:
+            payback_months = year1_cost / (total_benefit / 12)
+        elif total_benefit == year1_cost:
+            payback_months = 1.0
+        elif later_monthly > 0:
+            months_after_year1 = np.ceil((year1_cost - total_benefit) / later_monthly)
+            if months_after_year1 <= 48:  # 5 years max
+                payback_months = 12 + months_after_year1
+        return total_benefit, roi, npv, payback_months
+    
+    @njit(parallel=True, cache=True)
+    def _mc_kernel(seed, bed_count, annual_discharges_per_bed, nurse_hourly_cost,
+                   annual_benefits, rois, npvs, payback_periods):
+        """Draw and evaluate every Monte Carlo iteration in compiled code"""
+        # Iteration-invariant factors
+        turnovers_per_occupancy = bed_count * annual_discharges_per_bed
+        overtime_per_turnover = 0.5 * nurse_hourly_cost * 0.15
+        training_cost = bed_count * 0.5 * 4 * 50
+        
+        # Each block reseeds its thread's generator so results do not depend on scheduling
+        n = annual_benefits.shape[0]
+        n_chunks = (n + _MC_CHUNK - 1) // _MC_CHUNK
+        for chunk in prange(n_chunks):
+            np.random.seed(seed + chunk)
+            for i in range(chunk * _MC_CHUNK, min(n, (chunk + 1) * _MC_CHUNK)):
+                occupancy = np.random.beta(30, 10)
+                current_turnover = max(150.0, np.random.normal(180, 15))
+                revenue_per_bed = min(2500.0, max(1500.0, np.random.normal(2000, 200)))
+                impl_cost = np.random.triangular(300000, 350000, 400000)
+                maint_cost = max(35000.0, np.random.normal(50000, 8000))
+                margin = np.random.beta(8, 12)
+                discount_rate = np.random.uniform(0.07, 0.09)
+                annual_benefits[i], rois[i], npvs[i], payback_periods[i] = _mc_iteration(
+                    occupancy, current_turnover, revenue_per_bed, impl_cost, maint_cost, margin,
+                    discount_rate, turnovers_per_occupancy, overtime_per_turnover, training_cost
+                )
+    
+    @guvectorize([(t[:], t[:], t[:], t[:], t[:], t[:], t[:], t, t, t, t[:], t[:], t[:], t[:])
+                  for t in (float32, float64)],
+                 '(n),(n),(n),(n),(n),(n),(n),(),(),()->(n),(n),(n),(n)', nopython=True, cache=True)
+    def _mc_gufunc(occupancy, current_turnover, revenue_per_bed, impl_cost, maint_cost, margin,
+                   discount_rate, bed_count, annual_discharges_per_bed, nurse_hourly_cost,
+                   annual_benefits, rois, npvs, payback_periods):
+        """Evaluate pre-drawn iterations of one hospital; NumPy broadcasts it over leading axes"""
+        turnovers_per_occupancy = bed_count * annual_discharges_per_bed
+        overtime_per_turnover = 0.5 * nurse_hourly_cost * 0.15
+        training_cost = bed_count * 0.5 * 4 * 50
+        for i in range(occupancy.shape[0]):
+            annual_benefits[i], rois[i], npvs[i], payback_periods[i] = _mc_iteration(
+                occupancy[i], current_turnover[i], revenue_per_bed[i], impl_cost[i], maint_cost[i],
+                margin[i], discount_rate[i], turnovers_per_occupancy, overtime_per_turnover, training_cost
+            )
+
+@dataclass(frozen=True)
+class BaselineMetrics:
+    """Current-state operational metrics (calculate_baseline_metrics)"""
+    operational_beds: float
+    annual_turnovers: float
+    current_turnover_minutes: float
+    excess_minutes_per_turnover: float
+    annual_lost_hours: float
+    annual_lost_bed_days: float
+    equivalent_beds_lost: float
+
+
+@dataclass(frozen=True)
+class ImprovementImpact:
+    """Annual gains from reaching the target turnover time (calculate_improvement_impact)"""
+    time_saved_per_turnover: float
+    annual_hours_saved: float
+    annual_bed_days_gained: float
+    direct_revenue_gain: float
+    ed_boarding_savings: float
+    surgery_cancellation_savings: float
+    overtime_reduction: float
+    total_annual_benefit: float
+
+
+@dataclass(frozen=True)
+class ImplementationCosts:
+    """One-off and recurring costs (calculate_implementation_costs)"""
+    implementation_cost: float
+    training_costs: float
+    year1_total_cost: float
+    annual_maintenance_cost: float
+
+
+@dataclass(frozen=True)
+class ROIResult:
+    """Multi-year return on the initiative (calculate_roi)"""
+    years_analyzed: int
+    cash_flows: Tuple[float, ...]
+    npv: float
+    payback_months: Optional[int]
+    total_investment: float
+    total_return: float
+    roi_percentage: float
+    annual_roi: float
+
+
+# Point-estimate stages are pure functions of config values; their frozen results are
+# shared between calculators with the same configuration. Caches are typed because some
+# fields are printed unformatted, so 90 and 90.0 must not share an entry
+
+def _memoized(func, *args):
+    """func(*args) through its lru_cache, or uncached when an argument is unhashable"""
+    try:
+        return func(*args)
+    except TypeError:  # unhashable config value, e.g. a list
+        return func.__wrapped__(*args)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _baseline_metrics(bed_count, average_occupancy, annual_discharges_per_bed,
+                      current_turnover_minutes, target_turnover_minutes):
+    """BaselineMetrics for one configuration, memoized across calculators"""
+    # Total operational beds
+    operational_beds = bed_count * average_occupancy
+    
+    # Annual turnovers
+    annual_turnovers = operational_beds * annual_discharges_per_bed
+    
+    # Current lost time
+    current_excess_minutes = current_turnover_minutes - target_turnover_minutes
+    annual_lost_hours = (annual_turnovers * current_excess_minutes) / 60
+    annual_lost_bed_days = annual_lost_hours / 24
+    
+    # Equivalent bed capacity lost
+    equivalent_beds_lost = annual_lost_bed_days / 365
+    
+    return BaselineMetrics(
+        operational_beds=operational_beds,
+        annual_turnovers=annual_turnovers,
+        current_turnover_minutes=current_turnover_minutes,
+        excess_minutes_per_turnover=current_excess_minutes,
+        annual_lost_hours=annual_lost_hours,
+        annual_lost_bed_days=annual_lost_bed_days,
+        equivalent_beds_lost=equivalent_beds_lost
+    )
+
+
+@lru_cache(maxsize=256, typed=True)
+def _improvement_impact(annual_turnovers, current_turnover_minutes, target_turnover_minutes,
+                        revenue_per_bed_day, nurse_hourly_cost):
+    """ImprovementImpact for one configuration, memoized across calculators"""
+    # Time savings
+    time_saved_per_turnover = current_turnover_minutes - target_turnover_minutes
+    annual_hours_saved = (annual_turnovers * time_saved_per_turnover) / 60
+    annual_bed_days_gained = annual_hours_saved / 24
+    
+    # Revenue impact
+    direct_revenue_gain = annual_bed_days_gained * revenue_per_bed_day
+    
+    # Additional benefits
+    # Reduced ED boarding (estimate 10% reduction in boarding hours)
+    ed_boarding_savings = direct_revenue_gain * 0.1
+    
+    # Reduced surgery cancellations (estimate 5% reduction)
+    surgery_cancellation_savings = direct_revenue_gain * 0.05
+    
+    # Overtime reduction (less rush during peak times)
+    overtime_reduction = annual_turnovers * 0.5 * nurse_hourly_cost * 0.15
+    
+    # Total annual benefit
+    total_annual_benefit = (
+        direct_revenue_gain + 
+        ed_boarding_savings + 
+        surgery_cancellation_savings + 
+        overtime_reduction
+    )
+    
+    return ImprovementImpact(
+        time_saved_per_turnover=time_saved_per_turnover,
+        annual_hours_saved=annual_hours_saved,
+        annual_bed_days_gained=annual_bed_days_gained,
+        direct_revenue_gain=direct_revenue_gain,
+        ed_boarding_savings=ed_boarding_savings,
+        surgery_cancellation_savings=surgery_cancellation_savings,
+        overtime_reduction=overtime_reduction,
+        total_annual_benefit=total_annual_benefit
+    )
+
+
+@lru_cache(maxsize=256, typed=True)
+def _implementation_costs(bed_count, implementation_cost, annual_maintenance_cost,
+                          nurse_hourly_cost, evs_hourly_cost):
+    """ImplementationCosts for one configuration, memoized across calculators"""
+    # Year 1 costs
+    year1_costs = implementation_cost
+    
+    # Ongoing annual costs
+    annual_costs = annual_maintenance_cost
+    
+    # Training costs (estimate 4 hours per staff member)
+    staff_count = bed_count * 0.5  # Rough estimate
+    training_costs = staff_count * 4 * ((nurse_hourly_cost + evs_hourly_cost) / 2)
+    
+    return ImplementationCosts(
+        implementation_cost=implementation_cost,
+        training_costs=training_costs,
+        year1_total_cost=year1_costs + training_costs,
+        annual_maintenance_cost=annual_costs
+    )
+
+
+@lru_cache(maxsize=256, typed=True)
+def _roi_result(improvement, costs, years):
+    """ROIResult over years for one improvement/cost pair, memoized across calculators"""
+    # Cash flow analysis
+    # Subsequent years: Benefits minus maintenance
+    cash_flows = np.full(years, improvement.total_annual_benefit - costs.annual_maintenance_cost)
+    # Year 1: Implementation costs offset by benefits
+    cash_flows[0] = improvement.total_annual_benefit - costs.year1_total_cost
+    
+    # Calculate NPV (assuming 8% discount rate) against one precomputed discount vector
+    discount_rate = 0.08
+    discount = (1 + discount_rate) ** np.arange(years)
+    npv = float(np.dot(cash_flows, 1.0 / discount))
+    
+    # Calculate payback period: the first month the cumulative cash flow turns non-negative,
+    # in closed form since monthly flows are constant within year 1 and within later years
+    year1_monthly_cf = (improvement.total_annual_benefit - costs.year1_total_cost) / 12
+    later_monthly_cf = (improvement.total_annual_benefit - costs.annual_maintenance_cost) / 12
+    payback_months = None
+    if year1_monthly_cf >= 0:
+        payback_months = 1
+    elif later_monthly_cf > 0:
+        months_after_year1 = math.ceil(-12 * year1_monthly_cf / later_monthly_cf)
+        if months_after_year1 <= (years - 1) * 12:
+            payback_months = 12 + months_after_year1
+    
+    # ROI calculation
+    total_investment = costs.year1_total_cost + (costs.annual_maintenance_cost * (years - 1))
+    total_return = improvement.total_annual_benefit * years
+    roi_percentage = ((total_return - total_investment) / total_investment) * 100
+    
+    return ROIResult(
+        years_analyzed=years,
+        cash_flows=tuple(cash_flows.tolist()),
+        npv=npv,
+        payback_months=payback_months,
+        total_investment=total_investment,
+        total_return=total_return,
+        roi_percentage=roi_percentage,
+        annual_roi=roi_percentage / years
+    )
+
+
+# generate_report sections, filled by one str.format call over the result bundles
+_REPORT_HEADER = """
+BED TURNOVER IMPROVEMENT - {title}
+=================================================================
+
+HOSPITAL CONFIGURATION
+---------------------
+• Total Beds: {config[bed_count]}
+• Average Occupancy: {config[average_occupancy]:.1%}
+• Revenue per Bed Day: ${config[revenue_per_bed_day]:,}
+• Current Turnover Time: {config[current_turnover_minutes]} minutes
+• Target Turnover Time: {config[target_turnover_minutes]} minutes
+
+CURRENT STATE ANALYSIS
+---------------------
+• Annual Turnovers: {baseline.annual_turnovers:,.0f}
+• Excess Time per Turnover: {baseline.excess_minutes_per_turnover} minutes
+• Annual Lost Bed Days: {baseline.annual_lost_bed_days:,.0f}
+• Equivalent Beds Lost: {baseline.equivalent_beds_lost:.1f}
+
+IMPROVEMENT OPPORTUNITY (POINT ESTIMATE)
+---------------------------------------
+• Time Saved per Turnover: {improvement.time_saved_per_turnover} minutes
+• Annual Bed Days Gained: {improvement.annual_bed_days_gained:,.0f}
+• Direct Revenue Gain: ${improvement.direct_revenue_gain:,.0f}
+• Additional Benefits:
+  - ED Boarding Reduction: ${improvement.ed_boarding_savings:,.0f}
+  - Surgery Cancellation Reduction: ${improvement.surgery_cancellation_savings:,.0f}
+  - Overtime Reduction: ${improvement.overtime_reduction:,.0f}
+• Total Annual Benefit: ${improvement.total_annual_benefit:,.0f}
+
+"""
+
+_REPORT_MONTE_CARLO = """MONTE CARLO SIMULATION RESULTS (95% CONFIDENCE INTERVALS)
+--------------------------------------------------------
+Based on {mc[n_iterations]:,} simulations with REALISTIC stochastic inputs:
+
+MODELING ASSUMPTIONS (Updated for Realism):
+• Occupancy: Beta(30,10) - hospitals know occupancy within ±5%
+• Current Turnover: Normal(180,15) - daily variation is limited  
+• Target Turnover: Fixed at 90 min - controlled implementation target
+• Revenue/Bed: Normal(2000,200) clipped - predictable within facility
+• Profit Margin: Beta(8,12) - tighter margin estimates
+• Additional Benefits: Fixed percentages - policy decisions, not random
+
+• Annual Benefit:
+  - Mean: ${mc[annual_benefit][mean]:,.0f}
+  - 95% CI: ${mc[annual_benefit][ci_lower]:,.0f} - ${mc[annual_benefit][ci_upper]:,.0f}
+  - Range Factor: {range_factor:.1f}x
+
+• Net Present Value (5-year):
+  - Mean: ${mc[npv][mean]:,.0f}
+  - 95% CI: ${mc[npv][ci_lower]:,.0f} - ${mc[npv][ci_upper]:,.0f}
+  - Probability of Positive NPV: {mc[positive_npv_probability]:.1%}
+
+• Payback Period:
+  - Median: {mc[payback_months][median]:.0f} months
+  - 95% CI: {mc[payback_months][ci_lower]:.0f} - {mc[payback_months][ci_upper]:.0f} months
+  - Break-even Probability: {mc[break_even_probability]:.1%}
+
+• Return on Investment:
+  - Mean: {mc[roi_percentage][mean]:.0f}%
+  - 95% CI: {mc[roi_percentage][ci_lower]:.0f}% - {mc[roi_percentage][ci_upper]:.0f}%
+
+"""
+
+_REPORT_INVESTMENT = """INVESTMENT REQUIRED
+------------------
+• Implementation Cost: ${costs.implementation_cost:,}
+• Training Cost: ${costs.training_costs:,.0f}
+• Year 1 Total: ${costs.year1_total_cost:,.0f}
+• Annual Maintenance: ${costs.annual_maintenance_cost:,}
+
+"""
+
+_REPORT_RISK = """RISK-ADJUSTED RECOMMENDATION
+---------------------------
+Based on this analysis with REALISTIC uncertainty quantification:
+• {mc[break_even_probability]:.0%} probability of breaking even within 5 years
+• {mc[positive_npv_probability]:.0%} probability of positive NPV
+• Expected payback period: {mc[payback_months][median]:.0f} months (95% CI: {mc[payback_months][ci_lower]:.0f}-{mc[payback_months][ci_upper]:.0f})
+• Effectively adds {baseline.equivalent_beds_lost:.1f} beds of capacity without construction
+
+UNCERTAINTY MODELING IMPROVEMENTS:
+This analysis uses realistic distributions that reflect healthcare operational constraints,
+producing believable confidence intervals (~3x range) instead of unrealistic 10x ranges.
+Key improvements: fixed target times, tighter occupancy variation, eliminated lognormal 
+outliers, and reduced compounding of multiplicative uncertainties.
+"""
+
+_REPORT_POINT_RECOMMENDATION = """RECOMMENDATION (POINT ESTIMATE)
+------------------------------
+• {roi.years_analyzed}-year NPV: ${roi.npv:,.0f}
+• Payback period: {payback}
+• Return on Investment: {roi.roi_percentage:.0f}%
+• Effectively adds {baseline.equivalent_beds_lost:.1f} beds of capacity without construction
+"""
 
 
 class BedTurnoverROICalculator:
@@ -36,96 +418,33 @@ class BedTurnoverROICalculator:
     
     def calculate_baseline_metrics(self):
         """Calculate baseline operational metrics"""
-        # Total operational beds
-        operational_beds = self.config['bed_count'] * self.config['average_occupancy']
-        
-        # Annual turnovers
-        annual_turnovers = operational_beds * self.config['annual_discharges_per_bed']
-        
-        # Current lost time
-        current_excess_minutes = self.config['current_turnover_minutes'] - self.config['target_turnover_minutes']
-        annual_lost_hours = (annual_turnovers * current_excess_minutes) / 60
-        annual_lost_bed_days = annual_lost_hours / 24
-        
-        # Equivalent bed capacity lost
-        equivalent_beds_lost = annual_lost_bed_days / 365
-        
-        self.results['baseline'] = {
-            'operational_beds': operational_beds,
-            'annual_turnovers': annual_turnovers,
-            'current_turnover_minutes': self.config['current_turnover_minutes'],
-            'excess_minutes_per_turnover': current_excess_minutes,
-            'annual_lost_hours': annual_lost_hours,
-            'annual_lost_bed_days': annual_lost_bed_days,
-            'equivalent_beds_lost': equivalent_beds_lost
-        }
-        
+        self.results['baseline'] = _memoized(
+            _baseline_metrics, self.config['bed_count'], self.config['average_occupancy'],
+            self.config['annual_discharges_per_bed'], self.config['current_turnover_minutes'],
+            self.config['target_turnover_minutes']
+        )
         return self.results['baseline']
     
     def calculate_improvement_impact(self):
         """Calculate impact of achieving target turnover time"""
         baseline = self.results.get('baseline')
-        if not baseline:
+        if baseline is None:
             baseline = self.calculate_baseline_metrics()
         
-        # Time savings
-        time_saved_per_turnover = self.config['current_turnover_minutes'] - self.config['target_turnover_minutes']
-        annual_hours_saved = (baseline['annual_turnovers'] * time_saved_per_turnover) / 60
-        annual_bed_days_gained = annual_hours_saved / 24
-        
-        # Revenue impact
-        direct_revenue_gain = annual_bed_days_gained * self.config['revenue_per_bed_day']
-        
-        # Additional benefits
-        # Reduced ED boarding (estimate 10% reduction in boarding hours)
-        ed_boarding_savings = direct_revenue_gain * 0.1
-        
-        # Reduced surgery cancellations (estimate 5% reduction)
-        surgery_cancellation_savings = direct_revenue_gain * 0.05
-        
-        # Overtime reduction (less rush during peak times)
-        overtime_reduction = baseline['annual_turnovers'] * 0.5 * self.config['nurse_hourly_cost'] * 0.15
-        
-        # Total annual benefit
-        total_annual_benefit = (
-            direct_revenue_gain + 
-            ed_boarding_savings + 
-            surgery_cancellation_savings + 
-            overtime_reduction
+        self.results['improvement'] = _memoized(
+            _improvement_impact, baseline.annual_turnovers, self.config['current_turnover_minutes'],
+            self.config['target_turnover_minutes'], self.config['revenue_per_bed_day'],
+            self.config['nurse_hourly_cost']
         )
-        
-        self.results['improvement'] = {
-            'time_saved_per_turnover': time_saved_per_turnover,
-            'annual_hours_saved': annual_hours_saved,
-            'annual_bed_days_gained': annual_bed_days_gained,
-            'direct_revenue_gain': direct_revenue_gain,
-            'ed_boarding_savings': ed_boarding_savings,
-            'surgery_cancellation_savings': surgery_cancellation_savings,
-            'overtime_reduction': overtime_reduction,
-            'total_annual_benefit': total_annual_benefit
-        }
-        
         return self.results['improvement']
     
     def calculate_implementation_costs(self):
         """Calculate implementation and ongoing costs"""
-        # Year 1 costs
-        year1_costs = self.config['implementation_cost']
-        
-        # Ongoing annual costs
-        annual_costs = self.config['annual_maintenance_cost']
-        
-        # Training costs (estimate 4 hours per staff member)
-        staff_count = self.config['bed_count'] * 0.5  # Rough estimate
-        training_costs = staff_count * 4 * ((self.config['nurse_hourly_cost'] + self.config['evs_hourly_cost']) / 2)
-        
-        self.results['costs'] = {
-            'implementation_cost': self.config['implementation_cost'],
-            'training_costs': training_costs,
-            'year1_total_cost': year1_costs + training_costs,
-            'annual_maintenance_cost': annual_costs
-        }
-        
+        self.results['costs'] = _memoized(
+            _implementation_costs, self.config['bed_count'], self.config['implementation_cost'],
+            self.config['annual_maintenance_cost'], self.config['nurse_hourly_cost'],
+            self.config['evs_hourly_cost']
+        )
         return self.results['costs']
     
     def calculate_roi(self, years=5):
@@ -135,64 +454,30 @@ class BedTurnoverROICalculator:
         if 'costs' not in self.results:
             self.calculate_implementation_costs()
         
-        improvement = self.results['improvement']
-        costs = self.results['costs']
-        
-        # Cash flow analysis
-        cash_flows = []
-        for year in range(years):
-            if year == 0:
-                # Year 1: Implementation costs offset by benefits
-                net_cash_flow = improvement['total_annual_benefit'] - costs['year1_total_cost']
-            else:
-                # Subsequent years: Benefits minus maintenance
-                net_cash_flow = improvement['total_annual_benefit'] - costs['annual_maintenance_cost']
-            cash_flows.append(net_cash_flow)
-        
-        # Calculate NPV (assuming 8% discount rate)
-        discount_rate = 0.08
-        npv = sum([cf / (1 + discount_rate) ** i for i, cf in enumerate(cash_flows)])
-        
-        # Calculate payback period
-        cumulative_cf = 0
-        payback_months = None
-        for month in range(years * 12):
-            year_idx = month // 12
-            if year_idx == 0:
-                monthly_cf = (improvement['total_annual_benefit'] - costs['year1_total_cost']) / 12
-            else:
-                monthly_cf = (improvement['total_annual_benefit'] - costs['annual_maintenance_cost']) / 12
-            
-            cumulative_cf += monthly_cf
-            if cumulative_cf >= 0 and payback_months is None:
-                payback_months = month + 1
-        
-        # ROI calculation
-        total_investment = costs['year1_total_cost'] + (costs['annual_maintenance_cost'] * (years - 1))
-        total_return = improvement['total_annual_benefit'] * years
-        roi_percentage = ((total_return - total_investment) / total_investment) * 100
-        
-        self.results['roi'] = {
-            'years_analyzed': years,
-            'cash_flows': cash_flows,
-            'npv': npv,
-            'payback_months': payback_months,
-            'total_investment': total_investment,
-            'total_return': total_return,
-            'roi_percentage': roi_percentage,
-            'annual_roi': roi_percentage / years
-        }
+        self.results['roi'] = _memoized(_roi_result, self.results['improvement'],
+                                        self.results['costs'], years)
         
         return self.results['roi']
     
+    @staticmethod
+    def _benefit(bed_count, occupancy, annual_discharges_per_bed, current_turnover_minutes,
+                 target_turnover_minutes, revenue_per_bed_day, nurse_hourly_cost):
+        """Total annual benefit as in calculate_improvement_impact, broadcasting over array inputs"""
+        annual_turnovers = bed_count * occupancy * annual_discharges_per_bed
+        annual_bed_days_gained = (annual_turnovers * (current_turnover_minutes - target_turnover_minutes)) / 60 / 24
+        direct_revenue_gain = annual_bed_days_gained * revenue_per_bed_day
+        
+        # ED boarding (10%) and surgery cancellation (5%) savings plus overtime reduction
+        return direct_revenue_gain * (1 + 0.1 + 0.05) + annual_turnovers * 0.5 * nurse_hourly_cost * 0.15
+    
     def sensitivity_analysis(self):
-        """Perform sensitivity analysis on key variables"""
-        base_improvement = self.results.get('improvement')
-        if not base_improvement:
-            base_improvement = self.calculate_improvement_impact()
-        
-        base_benefit = base_improvement['total_annual_benefit']
+        """
+        Perform sensitivity analysis on key variables
         
+        Besides the one-at-a-time sweeps, 'turnover_occupancy_surface' holds the
+        annual benefit over every (turnover reduction, occupancy) pair as an
+        (n_reductions, n_occupancies) array
+        """
         # Variables to test
         sensitivity_vars = {
             'turnover_reduction': range(30, 121, 15),  # Minutes saved
@@ -200,41 +485,217 @@ class BedTurnoverROICalculator:
             'revenue_per_bed': [1500, 1750, 2000, 2250, 2500]
         }
         
+        # Each sweep is one broadcast evaluation of the benefit formula; self.config is never touched
+        inputs = {
+            'bed_count': self.config['bed_count'],
+            'occupancy': self.config['average_occupancy'],
+            'annual_discharges_per_bed': self.config['annual_discharges_per_bed'],
+            'current_turnover_minutes': self.config['current_turnover_minutes'],
+            'target_turnover_minutes': self.config['target_turnover_minutes'],
+            'revenue_per_bed_day': self.config['revenue_per_bed_day'],
+            'nurse_hourly_cost': self.config['nurse_hourly_cost']
+        }
+        base_benefit = self._benefit(**inputs)
+        
+        def sweep(label, values, **overrides):
+            benefits = self._benefit(**{**inputs, **overrides})
+            changes = ((benefits - base_benefit) / base_benefit) * 100
+            return [
+                {label: value, 'annual_benefit': benefit, 'benefit_change_pct': change}
+                for value, benefit, change in zip(values, benefits.tolist(), changes.tolist())
+            ]
+        
         results = {}
         
         # Test turnover reduction
-        original_current = self.config['current_turnover_minutes']
-        turnover_results = []
-        for reduction in sensitivity_vars['turnover_reduction']:
-            self.config['current_turnover_minutes'] = self.config['target_turnover_minutes'] + reduction
-            impact = self.calculate_improvement_impact()
-            turnover_results.append({
-                'reduction_minutes': reduction,
-                'annual_benefit': impact['total_annual_benefit'],
-                'benefit_change_pct': ((impact['total_annual_benefit'] - base_benefit) / base_benefit) * 100
-            })
-        self.config['current_turnover_minutes'] = original_current
-        results['turnover_reduction'] = turnover_results
+        reductions = np.array(sensitivity_vars['turnover_reduction'])
+        results['turnover_reduction'] = sweep(
+            'reduction_minutes', sensitivity_vars['turnover_reduction'],
+            current_turnover_minutes=self.config['target_turnover_minutes'] + reductions
+        )
         
         # Test occupancy rate
-        original_occupancy = self.config['average_occupancy']
-        occupancy_results = []
-        for occupancy in sensitivity_vars['occupancy_rate']:
-            self.config['average_occupancy'] = occupancy
-            self.calculate_baseline_metrics()
-            impact = self.calculate_improvement_impact()
-            occupancy_results.append({
-                'occupancy_rate': occupancy,
-                'annual_benefit': impact['total_annual_benefit'],
-                'benefit_change_pct': ((impact['total_annual_benefit'] - base_benefit) / base_benefit) * 100
-            })
-        self.config['average_occupancy'] = original_occupancy
-        results['occupancy_rate'] = occupancy_results
+        occupancies = np.array(sensitivity_vars['occupancy_rate'])
+        results['occupancy_rate'] = sweep(
+            'occupancy_rate', sensitivity_vars['occupancy_rate'],
+            occupancy=occupancies
+        )
+        
+        # Both together: the full surface from one call, reductions down the rows, occupancy across
+        surface = self._benefit(**{
+            **inputs,
+            'current_turnover_minutes': self.config['target_turnover_minutes'] + reductions[:, None],
+            'occupancy': occupancies[None, :]
+        })
+        results['turnover_occupancy_surface'] = {
+            'reduction_minutes': list(sensitivity_vars['turnover_reduction']),
+            'occupancy_rate': list(sensitivity_vars['occupancy_rate']),
+            'annual_benefit': surface,
+            'benefit_change_pct': ((surface - base_benefit) / base_benefit) * 100
+        }
         
         self.results['sensitivity'] = results
         return results
     
-    def monte_carlo_simulation(self, n_iterations=10000, confidence_level=0.95):
+    @staticmethod
+    def _draw_inputs(rng, shape, dtype=np.float64):
+        """
+        Stochastic Monte Carlo inputs drawn from rng, each an array of the given shape and dtype
+        
+        Returns (occupancy, current_turnover, revenue_per_bed, impl_cost, maint_cost,
+        margin, discount_rate), the argument order of _simulate and _mc_gufunc
+        """
+        # Sample every iteration's inputs at once from REALISTIC distributions
+        
+        # Occupancy rate - Much tighter Beta distribution (hospitals know their occupancy well)
+        # Beta(30, 10) gives mean 0.75 with realistic ±5% variation
+        occupancy = rng.beta(30, 10, shape)  # Mean ~0.75, 95% CI: 0.61-0.87
+        
+        # Current turnover time - Smaller variation (hospitals don't vary by hours daily)
+        current_turnover = rng.normal(180, 15, shape)  # 3 hours ± 15 min (reduced from 30)
+        current_turnover = np.maximum(current_turnover, 150)  # Floor at 2.5 hours
+        
+        # Revenue per bed day - Truncated normal instead of lognormal (prevents outliers)
+        revenue_per_bed = rng.normal(2000, 200, shape)  # Much tighter than lognormal
+        revenue_per_bed = np.clip(revenue_per_bed, 1500, 2500)  # Reasonable bounds
+        
+        # Implementation cost - Tighter triangular distribution
+        impl_cost = rng.triangular(300000, 350000, 400000, shape)  # Narrower range
+        
+        # Annual maintenance cost - Tighter normal distribution
+        maint_cost = rng.normal(50000, 8000, shape)  # Reduced from 10000
+        maint_cost = np.maximum(maint_cost, 35000)
+        
+        # Revenue impact with tighter margin uncertainty
+        # Beta(8, 12) gives mean 0.4 with much tighter distribution
+        margin = rng.beta(8, 12, shape)  # Mean ~0.4, tighter than Beta(4,6)
+        
+        # 5-year NPV with smaller discount rate uncertainty
+        discount_rate = rng.uniform(0.07, 0.09, shape)  # Tighter range around 8%
+        
+        inputs = (occupancy, current_turnover, revenue_per_bed, impl_cost, maint_cost, margin, discount_rate)
+        return tuple(x.astype(dtype, copy=False) for x in inputs)
+    
+    @staticmethod
+    def _simulate(occupancy, current_turnover, revenue_per_bed, impl_cost, maint_cost, margin,
+                  discount_rate, bed_count, annual_discharges_per_bed, nurse_hourly_cost):
+        """
+        Annual benefits, ROIs, NPVs and payback months for drawn Monte Carlo inputs
+        
+        Results keep the inputs' dtype. The config values broadcast against the inputs,
+        so (H, n) draws with (H, 1) config columns simulate H hospitals at once
+        """
+        # Target turnover time - FIXED (hospitals control this implementation target)
+        target_turnover = 90  # Fixed target - no variation
+        
+        # Additional benefits with FIXED percentages (reducing compounding uncertainty)
+        # These are policy/operational decisions, not random variables
+        ed_benefit_pct = 0.10      # Fixed 10% (was uniform 5-15%)
+        surgery_benefit_pct = 0.05 # Fixed 5% (was uniform 3-8%)
+        overtime_benefit_pct = 0.15 # Fixed 15% (was uniform 10-20%)
+        
+        # Iteration-invariant factors, computed once rather than per element
+        revenue_uplift = 1 + ed_benefit_pct + surgery_benefit_pct
+        overtime_per_turnover = 0.5 * nurse_hourly_cost * overtime_benefit_pct
+        training_cost = bed_count * 0.5 * 4 * 50
+        
+        # Calculate all iterations together
+        annual_turnovers = occupancy * (bed_count * annual_discharges_per_bed)
+        
+        # Time savings
+        time_saved = current_turnover - target_turnover
+        annual_hours_saved = (annual_turnovers * time_saved) / 60
+        annual_bed_days_gained = annual_hours_saved / 24
+        direct_revenue = annual_bed_days_gained * revenue_per_bed * margin
+        
+        # Direct revenue plus ED boarding and surgery savings, plus overtime savings
+        total_benefit = direct_revenue * revenue_uplift + annual_turnovers * overtime_per_turnover
+        
+        # ROI calculation
+        year1_cost = impl_cost + training_cost
+        
+        # Cash flows with a trailing axis of 5 years, discounted with one factor row per iteration
+        cash_flows = np.empty(total_benefit.shape + (5,), dtype=total_benefit.dtype)
+        cash_flows[..., 0] = total_benefit - year1_cost
+        cash_flows[..., 1:] = (total_benefit - maint_cost)[..., None]
+        discount = (1 + discount_rate[..., None]) ** np.arange(5, dtype=discount_rate.dtype)
+        npvs = (cash_flows / discount).sum(axis=-1)
+        
+        # ROI percentage
+        total_investment = year1_cost + (maint_cost * 4)
+        total_return = total_benefit * 5
+        rois = ((total_return - total_investment) / total_investment) * 100
+        
+        # Payback period in months: first month the cumulative cash flow turns non-negative.
+        # Monthly flows are constant within year 1 and within years 2-5, so it has a closed form
+        year1_shortfall = year1_cost - total_benefit
+        later_monthly = (total_benefit - maint_cost) / 12
+        with np.errstate(divide='ignore', invalid='ignore'):
+            months_after_year1 = np.ceil(year1_shortfall / later_monthly)
+        payback_periods = np.where((later_monthly > 0) & (months_after_year1 <= 48),  # 5 years max
+                                   12 + months_after_year1, np.inf)
+        payback_periods[year1_shortfall <= 0] = 1
+        monthly_benefit = total_benefit / 12
+        quick = monthly_benefit > year1_cost / 12
+        payback_periods[quick] = year1_cost[quick] / monthly_benefit[quick]
+        payback_periods[total_benefit <= 0] = np.inf
+        
+        # No time saved means no benefit and a lost implementation cost
+        no_gain = time_saved <= 0
+        total_benefit[no_gain] = 0
+        rois[no_gain] = -100
+        payback_periods[no_gain] = np.inf
+        npvs[no_gain] = -impl_cost[no_gain]
+        
+        return total_benefit, rois, npvs, payback_periods
+    
+    @staticmethod
+    def _summarize_simulation(annual_benefits, rois, npvs, payback_periods, confidence_level):
+        """Summary dict of one run's 1-D result arrays, as returned by monte_carlo_simulation"""
+        n_iterations = len(npvs)
+        
+        # Calculate confidence intervals
+        alpha = 1 - confidence_level
+        lower_percentile = (alpha / 2) * 100
+        upper_percentile = (1 - alpha / 2) * 100
+        
+        # Remove infinite values for percentile calculations
+        paid_back = np.isfinite(payback_periods)
+        finite_paybacks = payback_periods[paid_back]
+        break_even_probability = float(paid_back.mean())
+        
+        percentiles = [50, lower_percentile, upper_percentile]
+        
+        def summarize(x):
+            # Median and both CI bounds from one np.percentile call (one partition of x)
+            median, ci_lower, ci_upper = np.percentile(x, percentiles).astype(np.float64)
+            return {'mean': np.mean(x, dtype=np.float64), 'median': median, 'std': np.std(x, dtype=np.float64),
+                    'ci_lower': ci_lower, 'ci_upper': ci_upper}
+        
+        if finite_paybacks.size:
+            payback_median, payback_lower, payback_upper = (
+                np.percentile(finite_paybacks, percentiles).astype(np.float64)
+            )
+            payback_summary = {'mean': np.mean(finite_paybacks, dtype=np.float64), 'median': payback_median,
+                               'ci_lower': payback_lower, 'ci_upper': payback_upper}
+        else:
+            payback_summary = dict.fromkeys(('mean', 'median', 'ci_lower', 'ci_upper'), np.inf)
+        
+        results = {
+            'annual_benefit': summarize(annual_benefits),
+            'roi_percentage': summarize(rois),
+            'npv': summarize(npvs),
+            'payback_months': payback_summary,
+            'break_even_probability': break_even_probability,
+            'positive_npv_probability': float((npvs > 0).mean()),
+            'n_iterations': n_iterations,
+            'confidence_level': confidence_level
+        }
+        
+        return results
+    
+    def monte_carlo_simulation(self, n_iterations=10000, confidence_level=0.95, use_numba=False,
+                               dtype=np.float32):
         """
         Run Monte Carlo simulation with realistic stochastic inputs to quantify uncertainty
         
@@ -244,6 +705,11 @@ class BedTurnoverROICalculator:
             Number of simulation iterations
         confidence_level : float
             Confidence level for interval calculation (default 0.95)
+        use_numba : bool
+            Run the iterations in one parallel JIT kernel (requires numba)
+        dtype : numpy dtype
+            Storage for the per-iteration arrays; float32 halves the bytes every
+            summary pass reads, and the summaries are accumulated in float64
         
         Returns:
         --------
@@ -257,159 +723,86 @@ class BedTurnoverROICalculator:
         - Revenue per bed is fairly predictable within a facility
         - Target times are controlled by the hospital
         """
-        np.random.seed(42)  # For reproducibility
-        
-        # Store results
-        annual_benefits = []
-        rois = []
-        payback_periods = []
-        npvs = []
-        
-        for i in range(n_iterations):
-            # Sample from REALISTIC distributions for key parameters
-            
-            # Occupancy rate - Much tighter Beta distribution (hospitals know their occupancy well)
-            # Beta(30, 10) gives mean 0.75 with realistic ±5% variation
-            occupancy = np.random.beta(30, 10)  # Mean ~0.75, 95% CI: 0.61-0.87
-            
-            # Current turnover time - Smaller variation (hospitals don't vary by hours daily)
-            current_turnover = np.random.normal(180, 15)  # 3 hours ± 15 min (reduced from 30)
-            current_turnover = max(150, current_turnover)  # Floor at 2.5 hours
-            
-            # Target turnover time - FIXED (hospitals control this implementation target)
-            target_turnover = 90  # Fixed target - no variation
-            
-            # Revenue per bed day - Truncated normal instead of lognormal (prevents outliers)
-            revenue_per_bed = np.random.normal(2000, 200)  # Much tighter than lognormal
-            revenue_per_bed = max(1500, min(2500, revenue_per_bed))  # Reasonable bounds
-            
-            # Implementation cost - Tighter triangular distribution
-            impl_cost = np.random.triangular(300000, 350000, 400000)  # Narrower range
-            
-            # Annual maintenance cost - Tighter normal distribution
-            maint_cost = np.random.normal(50000, 8000)  # Reduced from 10000
-            maint_cost = max(35000, maint_cost)
-            
-            # Calculate for this iteration
-            operational_beds = self.config['bed_count'] * occupancy
-            annual_turnovers = operational_beds * self.config['annual_discharges_per_bed']
-            
-            # Time savings
-            time_saved = current_turnover - target_turnover
-            if time_saved <= 0:
-                annual_benefits.append(0)
-                rois.append(-100)
-                payback_periods.append(np.inf)
-                npvs.append(-impl_cost)
-                continue
-            
-            annual_hours_saved = (annual_turnovers * time_saved) / 60
-            annual_bed_days_gained = annual_hours_saved / 24
-            
-            # Revenue impact with tighter margin uncertainty
-            # Beta(8, 12) gives mean 0.4 with much tighter distribution
-            margin = np.random.beta(8, 12)  # Mean ~0.4, tighter than Beta(4,6)
-            direct_revenue = annual_bed_days_gained * revenue_per_bed * margin
-            
-            # Additional benefits with FIXED percentages (reducing compounding uncertainty)
-            # These are policy/operational decisions, not random variables
-            ed_benefit_pct = 0.10      # Fixed 10% (was uniform 5-15%)
-            surgery_benefit_pct = 0.05 # Fixed 5% (was uniform 3-8%)
-            overtime_benefit_pct = 0.15 # Fixed 15% (was uniform 10-20%)
-            
-            ed_boarding_savings = direct_revenue * ed_benefit_pct
-            surgery_savings = direct_revenue * surgery_benefit_pct
-            overtime_savings = annual_turnovers * 0.5 * self.config['nurse_hourly_cost'] * overtime_benefit_pct
-            
-            total_benefit = direct_revenue + ed_boarding_savings + surgery_savings + overtime_savings
-            annual_benefits.append(total_benefit)
-            
-            # ROI calculation
-            year1_cost = impl_cost + (self.config['bed_count'] * 0.5 * 4 * 50)  # Training
-            
-            # 5-year NPV with smaller discount rate uncertainty
-            discount_rate = np.random.uniform(0.07, 0.09)  # Tighter range around 8%
-            cash_flows = [total_benefit - year1_cost] + [total_benefit - maint_cost] * 4
-            npv = sum([cf / (1 + discount_rate) ** i for i, cf in enumerate(cash_flows)])
-            npvs.append(npv)
-            
-            # ROI percentage
-            total_investment = year1_cost + (maint_cost * 4)
-            total_return = total_benefit * 5
-            roi_pct = ((total_return - total_investment) / total_investment) * 100
-            rois.append(roi_pct)
-            
-            # Payback period in months
-            if total_benefit > 0:
-                monthly_benefit = total_benefit / 12
-                monthly_cost_y1 = year1_cost / 12
-                if monthly_benefit > monthly_cost_y1:
-                    payback_months = year1_cost / monthly_benefit
-                else:
-                    # Calculate cumulative cash flow
-                    cumulative = 0
-                    for month in range(60):  # 5 years max
-                        if month < 12:
-                            cumulative += (total_benefit - year1_cost) / 12
-                        else:
-                            cumulative += (total_benefit - maint_cost) / 12
-                        if cumulative >= 0:
-                            payback_months = month + 1
-                            break
-                    else:
-                        payback_months = np.inf
-                payback_periods.append(payback_months)
-            else:
-                payback_periods.append(np.inf)
-        
-        # Calculate confidence intervals
-        alpha = 1 - confidence_level
-        lower_percentile = (alpha / 2) * 100
-        upper_percentile = (1 - alpha / 2) * 100
-        
-        # Remove infinite values for percentile calculations
-        finite_paybacks = [p for p in payback_periods if p != np.inf]
-        break_even_probability = len(finite_paybacks) / n_iterations
-        
-        results = {
-            'annual_benefit': {
-                'mean': np.mean(annual_benefits),
-                'median': np.median(annual_benefits),
-                'std': np.std(annual_benefits),
-                'ci_lower': np.percentile(annual_benefits, lower_percentile),
-                'ci_upper': np.percentile(annual_benefits, upper_percentile)
-            },
-            'roi_percentage': {
-                'mean': np.mean(rois),
-                'median': np.median(rois),
-                'std': np.std(rois),
-                'ci_lower': np.percentile(rois, lower_percentile),
-                'ci_upper': np.percentile(rois, upper_percentile)
-            },
-            'npv': {
-                'mean': np.mean(npvs),
-                'median': np.median(npvs),
-                'std': np.std(npvs),
-                'ci_lower': np.percentile(npvs, lower_percentile),
-                'ci_upper': np.percentile(npvs, upper_percentile)
-            },
-            'payback_months': {
-                'mean': np.mean(finite_paybacks) if finite_paybacks else np.inf,
-                'median': np.median(finite_paybacks) if finite_paybacks else np.inf,
-                'ci_lower': np.percentile(finite_paybacks, lower_percentile) if finite_paybacks else np.inf,
-                'ci_upper': np.percentile(finite_paybacks, upper_percentile) if finite_paybacks else np.inf
-            },
-            'break_even_probability': break_even_probability,
-            'positive_npv_probability': sum(1 for n in npvs if n > 0) / n_iterations,
-            'n_iterations': n_iterations,
-            'confidence_level': confidence_level
-        }
+        if use_numba and njit is None:
+            raise ImportError("use_numba=True requires the numba package")
+        rng = np.random.default_rng(42)  # For reproducibility
+        
+        if use_numba:
+            # The kernel reseeds per block from this stream, so runs stay reproducible
+            seed = int(rng.integers(2**31))
+            annual_benefits = np.empty(n_iterations, dtype=dtype)
+            rois = np.empty(n_iterations, dtype=dtype)
+            npvs = np.empty(n_iterations, dtype=dtype)
+            payback_periods = np.empty(n_iterations, dtype=dtype)
+            _mc_kernel(seed, self.config['bed_count'], self.config['annual_discharges_per_bed'],
+                       self.config['nurse_hourly_cost'], annual_benefits, rois, npvs, payback_periods)
+        else:
+            annual_benefits, rois, npvs, payback_periods = self._simulate(
+                *self._draw_inputs(rng, (n_iterations,), dtype), self.config['bed_count'],
+                self.config['annual_discharges_per_bed'], self.config['nurse_hourly_cost']
+            )
+        
+        results = self._summarize_simulation(annual_benefits, rois, npvs, payback_periods, confidence_level)
         
         self.results['monte_carlo'] = results
         return results
     
-    def generate_report(self):
-        """Generate comprehensive ROI report with uncertainty analysis"""
+    @classmethod
+    def batch_monte_carlo(cls, configs, n_iterations=10000, confidence_level=0.95, use_numba=False,
+                          dtype=np.float32):
+        """
+        Run the Monte Carlo simulation for several hospitals in one broadcast pass
+        
+        Parameters:
+        -----------
+        configs : list of dict
+            One hospital_config per hospital (missing keys take the defaults)
+        n_iterations : int
+            Number of simulation iterations per hospital
+        confidence_level : float
+            Confidence level for interval calculation (default 0.95)
+        use_numba : bool
+            Evaluate the draws with a compiled gufunc instead of NumPy array
+            arithmetic (requires numba); the draws themselves are the same
+        dtype : numpy dtype
+            Storage for the (H, n_iterations) arrays, as in monte_carlo_simulation
+        
+        Returns:
+        --------
+        list of dict : One monte_carlo_simulation-style result per config, in order
+        """
+        if use_numba and njit is None:
+            raise ImportError("use_numba=True requires the numba package")
+        
+        # Config fields as (H, 1) columns so they broadcast against (H, n) draws
+        full_configs = [cls(config).config for config in configs]
+        columns = [
+            np.array([config[key] for config in full_configs], dtype=dtype)[:, None]
+            for key in ('bed_count', 'annual_discharges_per_bed', 'nurse_hourly_cost')
+        ]
+        
+        rng = np.random.default_rng(42)  # For reproducibility
+        inputs = cls._draw_inputs(rng, (len(full_configs), n_iterations), dtype)
+        if use_numba:
+            # Scalar core dimensions take one value per hospital row
+            annual_benefits, rois, npvs, payback_periods = _mc_gufunc(
+                *inputs, *(column[:, 0] for column in columns)
+            )
+        else:
+            annual_benefits, rois, npvs, payback_periods = cls._simulate(*inputs, *columns)
+        return [
+            cls._summarize_simulation(*rows, confidence_level)
+            for rows in zip(annual_benefits, rois, npvs, payback_periods)
+        ]
+    
+    def generate_report(self, include_mc=True, mc_iterations=10000):
+        """
+        Generate comprehensive ROI report with uncertainty analysis
+        
+        include_mc: add the Monte Carlo sections, running the simulation with
+        mc_iterations if it has not been run yet; False gives a point-estimate
+        report without paying for the simulation
+        """
         # Ensure all calculations are complete
         if 'baseline' not in self.results:
             self.calculate_baseline_metrics()
@@ -419,95 +812,31 @@ class BedTurnoverROICalculator:
             self.calculate_implementation_costs()
         if 'roi' not in self.results:
             self.calculate_roi()
-        if 'monte_carlo' not in self.results:
-            self.monte_carlo_simulation()
-        
-        mc = self.results['monte_carlo']
+        if include_mc and 'monte_carlo' not in self.results:
+            self.monte_carlo_simulation(n_iterations=mc_iterations)
+        
+        roi = self.results['roi']
+        values = {
+            'config': self.config,
+            'baseline': self.results['baseline'],
+            'improvement': self.results['improvement'],
+            'costs': self.results['costs'],
+            'roi': roi
+        }
         
-        report = f"""
-BED TURNOVER IMPROVEMENT - ROI ANALYSIS WITH REALISTIC UNCERTAINTY
-=================================================================
-
-HOSPITAL CONFIGURATION
----------------------
-• Total Beds: {self.config['bed_count']}
-• Average Occupancy: {self.config['average_occupancy']:.1%}
-• Revenue per Bed Day: ${self.config['revenue_per_bed_day']:,}
-• Current Turnover Time: {self.config['current_turnover_minutes']} minutes
-• Target Turnover Time: {self.config['target_turnover_minutes']} minutes
-
-CURRENT STATE ANALYSIS
----------------------
-• Annual Turnovers: {self.results['baseline']['annual_turnovers']:,.0f}
-• Excess Time per Turnover: {self.results['baseline']['excess_minutes_per_turnover']} minutes
-• Annual Lost Bed Days: {self.results['baseline']['annual_lost_bed_days']:,.0f}
-• Equivalent Beds Lost: {self.results['baseline']['equivalent_beds_lost']:.1f}
-
-IMPROVEMENT OPPORTUNITY (POINT ESTIMATE)
----------------------------------------
-• Time Saved per Turnover: {self.results['improvement']['time_saved_per_turnover']} minutes
-• Annual Bed Days Gained: {self.results['improvement']['annual_bed_days_gained']:,.0f}
-• Direct Revenue Gain: ${self.results['improvement']['direct_revenue_gain']:,.0f}
-• Additional Benefits:
-  - ED Boarding Reduction: ${self.results['improvement']['ed_boarding_savings']:,.0f}
-  - Surgery Cancellation Reduction: ${self.results['improvement']['surgery_cancellation_savings']:,.0f}
-  - Overtime Reduction: ${self.results['improvement']['overtime_reduction']:,.0f}
-• Total Annual Benefit: ${self.results['improvement']['total_annual_benefit']:,.0f}
-
-MONTE CARLO SIMULATION RESULTS (95% CONFIDENCE INTERVALS)
---------------------------------------------------------
-Based on {mc['n_iterations']:,} simulations with REALISTIC stochastic inputs:
-
-MODELING ASSUMPTIONS (Updated for Realism):
-• Occupancy: Beta(30,10) - hospitals know occupancy within ±5%
-• Current Turnover: Normal(180,15) - daily variation is limited  
-• Target Turnover: Fixed at 90 min - controlled implementation target
-• Revenue/Bed: Normal(2000,200) clipped - predictable within facility
-• Profit Margin: Beta(8,12) - tighter margin estimates
-• Additional Benefits: Fixed percentages - policy decisions, not random
-
-• Annual Benefit:
-  - Mean: ${mc['annual_benefit']['mean']:,.0f}
-  - 95% CI: ${mc['annual_benefit']['ci_lower']:,.0f} - ${mc['annual_benefit']['ci_upper']:,.0f}
-  - Range Factor: {mc['annual_benefit']['ci_upper']/mc['annual_benefit']['ci_lower']:.1f}x
-
-• Net Present Value (5-year):
-  - Mean: ${mc['npv']['mean']:,.0f}
-  - 95% CI: ${mc['npv']['ci_lower']:,.0f} - ${mc['npv']['ci_upper']:,.0f}
-  - Probability of Positive NPV: {mc['positive_npv_probability']:.1%}
-
-• Payback Period:
-  - Median: {mc['payback_months']['median']:.0f} months
-  - 95% CI: {mc['payback_months']['ci_lower']:.0f} - {mc['payback_months']['ci_upper']:.0f} months
-  - Break-even Probability: {mc['break_even_probability']:.1%}
-
-• Return on Investment:
-  - Mean: {mc['roi_percentage']['mean']:.0f}%
-  - 95% CI: {mc['roi_percentage']['ci_lower']:.0f}% - {mc['roi_percentage']['ci_upper']:.0f}%
-
-INVESTMENT REQUIRED
-------------------
-• Implementation Cost: ${self.results['costs']['implementation_cost']:,}
-• Training Cost: ${self.results['costs']['training_costs']:,.0f}
-• Year 1 Total: ${self.results['costs']['year1_total_cost']:,.0f}
-• Annual Maintenance: ${self.results['costs']['annual_maintenance_cost']:,}
-
-RISK-ADJUSTED RECOMMENDATION
----------------------------
-Based on this analysis with REALISTIC uncertainty quantification:
-• {mc['break_even_probability']:.0%} probability of breaking even within 5 years
-• {mc['positive_npv_probability']:.0%} probability of positive NPV
-• Expected payback period: {mc['payback_months']['median']:.0f} months (95% CI: {mc['payback_months']['ci_lower']:.0f}-{mc['payback_months']['ci_upper']:.0f})
-• Effectively adds {self.results['baseline']['equivalent_beds_lost']:.1f} beds of capacity without construction
-
-UNCERTAINTY MODELING IMPROVEMENTS:
-This analysis uses realistic distributions that reflect healthcare operational constraints,
-producing believable confidence intervals (~3x range) instead of unrealistic 10x ranges.
-Key improvements: fixed target times, tighter occupancy variation, eliminated lognormal 
-outliers, and reduced compounding of multiplicative uncertainties.
-"""
-        return report
-
+        if include_mc:
+            mc = self.results['monte_carlo']
+            values['title'] = "ROI ANALYSIS WITH REALISTIC UNCERTAINTY"
+            values['mc'] = mc
+            values['range_factor'] = mc['annual_benefit']['ci_upper'] / mc['annual_benefit']['ci_lower']
+            sections = (_REPORT_HEADER, _REPORT_MONTE_CARLO, _REPORT_INVESTMENT, _REPORT_RISK)
+        else:
+            values['title'] = "ROI ANALYSIS (POINT ESTIMATE)"
+            values['payback'] = (f"{roi.payback_months} months" if roi.payback_months is not None
+                                 else "beyond the analysis period")
+            sections = (_REPORT_HEADER, _REPORT_INVESTMENT, _REPORT_POINT_RECOMMENDATION)
+        
+        return "".join(sections).format(**values)
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+"""
+Checks for the correlation argument of the distribution analyses
+"""
+
+import pytest
+
+from distribution_analysis import analyze_distributions, realistic_distributions_analysis
+
+
+def test_correlation_rejects_unsampled_key():
+    # target_turnover is fixed in the realistic analysis, so it can't be correlated
+    with pytest.raises(ValueError, match="'target_turnover'"):
+        realistic_distributions_analysis(n_samples=64, correlation={('occupancy', 'target_turnover'): 0.3})
+
+
+def test_correlation_rejects_unknown_key():
+    with pytest.raises(ValueError, match="'ocupancy'"):
+        analyze_distributions(n_samples=64, correlation={('ocupancy', 'margin'): 0.3})
+
+
+def test_correlation_rejects_rho_out_of_range():
+    with pytest.raises(ValueError, match=r"\[-1, 1\]"):
+        analyze_distributions(n_samples=64, correlation={('occupancy', 'margin'): 1.5})
+
+
+def test_correlation_rejects_non_positive_definite_matrix():
+    # Each rho is in range, but the three pairs can't hold jointly
+    correlation = {('occupancy', 'margin'): 0.9,
+                   ('occupancy', 'revenue_per_bed'): 0.9,
+                   ('margin', 'revenue_per_bed'): -0.9}
+    with pytest.raises(ValueError, match="positive definite"):
+        analyze_distributions(n_samples=64, correlation=correlation)
+
+
+def test_valid_correlation_runs():
+    samples = analyze_distributions(n_samples=64, correlation={('occupancy', 'revenue_per_bed'): 0.3})
+    assert len(samples['occupancy']) == 64
@@ -14,9 +14,146 @@ Conduct facility-specific analysis with your actual data before making investmen
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from typing import Dict, Tuple
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+# Cost components in display order (the 'components' array of a breakdown)
+_COST_COMPONENTS = ('overtime_premium', 'agency_premium', 'turnover_cost',
+                    'sick_call_cost', 'productivity_loss')
+
+# State field driving each cost component, and the level above which it
+# costs anything (sick calls only count above 2 days)
+_STATE_KEYS = ('overtime_pct', 'agency_pct', 'turnover_rate', 'sick_call_rate', 'variance_pct')
+_STATE_BASELINE = np.array([0, 0, 0, 2, 0])
+
+# 5-year NPV at a 5% discount rate: year-1 discount factor and the
+# present value of 1/year over years 1-5
+_DF1 = 1 / 1.05
+_ANNUITY_5Y = (1 - 1.05 ** -5) / 0.05
+
+
+def _memoized(func, *args):
+    """func(*args) through its lru_cache, or uncached when an argument is unhashable"""
+    try:
+        return func(*args)
+    except TypeError:  # unhashable state, cost or implementation value
+        return func.__wrapped__(*args)
+
+
+@lru_cache(maxsize=32)
+def _cost_coefficients(costs: Tuple, total_nurses: int) -> np.ndarray:
+    """
+    Annual cost per point of each _STATE_KEYS field, for cost parameters
+    given as hashable (key, value) items; computed once per cost setting
+    """
+    costs = dict(costs)
+    total_nursing_hours = total_nurses * 2080  # Annual hours per FTE
+    hourly = costs['regular_hourly']
+    
+    coefficients = np.array([
+        # Overtime premium per % of hours
+        total_nursing_hours / 100 * hourly * (costs['overtime_multiplier'] - 1),
+        # Agency premium per % of hours
+        total_nursing_hours / 100 * hourly * (costs['agency_multiplier'] - 1),
+        # Turnover cost per % annual turnover
+        total_nurses / 100 * costs['turnover_cost_per_nurse'],
+        # Excess sick-call cost per sick-call point above baseline (due to burnout)
+        total_nurses * 8 * costs['sick_day_cost'],
+        # Productivity loss per % variance (estimated 5% productivity loss at 20%)
+        total_nursing_hours * hourly * 0.05 / 20,
+    ])
+    coefficients.flags.writeable = False
+    return coefficients
+
+
+def _state_costs(current_state: Dict, target_state: Dict, costs: Dict,
+                 total_nurses: int) -> Dict:
+    """Cost components for both states as length-2 arrays (0 = current, 1 = target)"""
+    
+    # Stack both states so every component is one multiply for both
+    coefficients = _memoized(_cost_coefficients, tuple(costs.items()), total_nurses)
+    states = np.array([
+        [state[key] for key in _STATE_KEYS] for state in (current_state, target_state)
+    ], dtype=float)
+    components = (states - _STATE_BASELINE) * coefficients
+    
+    state_costs = dict(zip(_COST_COMPONENTS, components.T))
+    state_costs['total_annual_cost'] = components.sum(axis=1)
+    return state_costs
+
+
+def _state_breakdown(state_costs: Dict, index: int) -> Dict:
+    """Scalar cost breakdown for one state (0 = current, 1 = target)"""
+    breakdown = {key: float(value[index]) for key, value in state_costs.items()}
+    components = np.array([breakdown[key] for key in _COST_COMPONENTS])
+    components.flags.writeable = False  # may be shared through the ROI cache
+    breakdown['components'] = components
+    return breakdown
+
+
+@lru_cache(maxsize=32)
+def _roi_cached(current_state: Tuple, target_state: Tuple, costs: Tuple,
+                implementation: Tuple, total_nurses: int) -> Dict:
+    """
+    ROI metrics for the calculator inputs given as hashable (key, value)
+    item tuples. Memoized: any change to a state or cost dict yields a new key.
+    Callers must not mutate the returned dict (see calculate_roi).
+    """
+    
+    current_state, target_state = dict(current_state), dict(target_state)
+    costs, implementation = dict(costs), dict(implementation)
+    state_costs = _state_costs(current_state, target_state, costs, total_nurses)
+    current_costs = _state_breakdown(state_costs, 0)
+    target_costs = _state_breakdown(state_costs, 1)
+    
+    # Annual savings
+    totals = state_costs['total_annual_cost']
+    annual_savings = float(totals[0] - totals[1])
+    
+    # One-time implementation costs
+    one_time_costs = (
+        implementation['software_platform'] +
+        implementation['training_hours'] * costs['regular_hourly'] +
+        implementation['consulting_days'] * implementation['consulting_rate'] +
+        implementation['flex_pool_setup']
+    )
+    
+    # Ongoing annual costs
+    ongoing_costs = (
+        implementation['annual_software'] +
+        implementation['flex_pool_incentive_annual']
+    )
+    
+    # Net savings
+    year1_net = annual_savings - one_time_costs - ongoing_costs
+    year2plus_net = annual_savings - ongoing_costs
+    
+    # ROI calculations
+    year1_roi = (year1_net / one_time_costs) * 100
+    ongoing_roi = (year2plus_net / ongoing_costs) * 100
+    payback_months = (one_time_costs / (annual_savings / 12)) if annual_savings > 0 else float('inf')
+    
+    # 5-year NPV (assuming 5% discount rate): year 1 plus a 4-year annuity
+    npv = year1_net * _DF1 + year2plus_net * (_ANNUITY_5Y - _DF1)
+    
+    return {
+        'current_annual_cost': current_costs['total_annual_cost'],
+        'target_annual_cost': target_costs['total_annual_cost'],
+        'annual_savings': annual_savings,
+        'one_time_investment': one_time_costs,
+        'ongoing_costs': ongoing_costs,
+        'year1_net_savings': year1_net,
+        'year2plus_net_savings': year2plus_net,
+        'year1_roi_pct': year1_roi,
+        'ongoing_roi_pct': ongoing_roi,
+        'payback_months': payback_months,
+        'five_year_npv': npv,
+        'weekly_savings': annual_savings / 52,
+        'cost_breakdown': {
+            'current': current_costs,
+            'target': target_costs
+        }
+    }
 
 
 class StaffingROICalculator:
@@ -76,180 +213,80 @@ class StaffingROICalculator:
             'flex_pool_incentive_annual': 120000,
         }
     
+    def calculate_state_costs(self) -> Dict:
+        """
+        Calculate annual costs due to staffing variance for the current and
+        target state in one vectorized pass
+        
+        Returns:
+            Dict of cost components, each a length-2 array indexed
+            0 = current state, 1 = target state
+        """
+        return _state_costs(self.current_state, self.target_state, self.costs, self.total_nurses)
+    
     def calculate_current_costs(self) -> Dict:
         """Calculate current annual costs due to staffing variance"""
-        
-        # Base calculations
-        total_nursing_hours = self.total_nurses * 2080  # Annual hours per FTE
-        
-        # Overtime costs
-        overtime_hours = total_nursing_hours * (self.current_state['overtime_pct'] / 100)
-        overtime_premium = overtime_hours * self.costs['regular_hourly'] * (self.costs['overtime_multiplier'] - 1)
-        
-        # Agency costs  
-        agency_hours = total_nursing_hours * (self.current_state['agency_pct'] / 100)
-        agency_premium = agency_hours * self.costs['regular_hourly'] * (self.costs['agency_multiplier'] - 1)
-        
-        # Turnover costs
-        annual_turnover = self.total_nurses * (self.current_state['turnover_rate'] / 100)
-        turnover_cost = annual_turnover * self.costs['turnover_cost_per_nurse']
-        
-        # Sick call costs (excess due to burnout)
-        excess_sick_days = self.total_nurses * (self.current_state['sick_call_rate'] - 2) * 8  # Days above baseline
-        sick_call_cost = excess_sick_days * self.costs['sick_day_cost']
-        
-        # Productivity loss due to variance (estimated 5% productivity loss)
-        productivity_loss = total_nursing_hours * self.costs['regular_hourly'] * 0.05 * (self.current_state['variance_pct'] / 20)
-        
-        return {
-            'overtime_premium': overtime_premium,
-            'agency_premium': agency_premium,
-            'turnover_cost': turnover_cost,
-            'sick_call_cost': sick_call_cost,
-            'productivity_loss': productivity_loss,
-            'total_annual_cost': overtime_premium + agency_premium + turnover_cost + sick_call_cost + productivity_loss
-        }
+        return _state_breakdown(self.calculate_state_costs(), 0)
     
     def calculate_target_costs(self) -> Dict:
         """Calculate costs after implementing variance reduction"""
-        
-        total_nursing_hours = self.total_nurses * 2080
-        
-        # Reduced overtime
-        overtime_hours = total_nursing_hours * (self.target_state['overtime_pct'] / 100)
-        overtime_premium = overtime_hours * self.costs['regular_hourly'] * (self.costs['overtime_multiplier'] - 1)
-        
-        # Reduced agency
-        agency_hours = total_nursing_hours * (self.target_state['agency_pct'] / 100)
-        agency_premium = agency_hours * self.costs['regular_hourly'] * (self.costs['agency_multiplier'] - 1)
-        
-        # Reduced turnover
-        annual_turnover = self.total_nurses * (self.target_state['turnover_rate'] / 100)
-        turnover_cost = annual_turnover * self.costs['turnover_cost_per_nurse']
-        
-        # Reduced sick calls
-        excess_sick_days = self.total_nurses * (self.target_state['sick_call_rate'] - 2) * 8
-        sick_call_cost = excess_sick_days * self.costs['sick_day_cost']
-        
-        # Improved productivity
-        productivity_loss = total_nursing_hours * self.costs['regular_hourly'] * 0.05 * (self.target_state['variance_pct'] / 20)
-        
-        return {
-            'overtime_premium': overtime_premium,
-            'agency_premium': agency_premium,
-            'turnover_cost': turnover_cost,
-            'sick_call_cost': sick_call_cost,
-            'productivity_loss': productivity_loss,
-            'total_annual_cost': overtime_premium + agency_premium + turnover_cost + sick_call_cost + productivity_loss
-        }
+        return _state_breakdown(self.calculate_state_costs(), 1)
     
     def calculate_roi(self) -> Dict:
         """Calculate ROI metrics for variance reduction initiative"""
         
-        current_costs = self.calculate_current_costs()
-        target_costs = self.calculate_target_costs()
-        
-        # Annual savings
-        annual_savings = current_costs['total_annual_cost'] - target_costs['total_annual_cost']
-        
-        # One-time implementation costs
-        one_time_costs = (
-            self.implementation['software_platform'] +
-            self.implementation['training_hours'] * self.costs['regular_hourly'] +
-            self.implementation['consulting_days'] * self.implementation['consulting_rate'] +
-            self.implementation['flex_pool_setup']
-        )
-        
-        # Ongoing annual costs
-        ongoing_costs = (
-            self.implementation['annual_software'] +
-            self.implementation['flex_pool_incentive_annual']
+        roi = _memoized(
+            _roi_cached,
+            tuple(self.current_state.items()),
+            tuple(self.target_state.items()),
+            tuple(self.costs.items()),
+            tuple(self.implementation.items()),
+            self.total_nurses
         )
-        
-        # Net savings
-        year1_net = annual_savings - one_time_costs - ongoing_costs
-        year2plus_net = annual_savings - ongoing_costs
-        
-        # ROI calculations
-        year1_roi = (year1_net / one_time_costs) * 100
-        ongoing_roi = (year2plus_net / ongoing_costs) * 100
-        payback_months = (one_time_costs / (annual_savings / 12)) if annual_savings > 0 else float('inf')
-        
-        # 5-year NPV (assuming 5% discount rate)
-        cashflows = [year1_net] + [year2plus_net] * 4
-        npv = sum([cf / (1.05 ** i) for i, cf in enumerate(cashflows, 1)])
-        
-        return {
-            'current_annual_cost': current_costs['total_annual_cost'],
-            'target_annual_cost': target_costs['total_annual_cost'],
-            'annual_savings': annual_savings,
-            'one_time_investment': one_time_costs,
-            'ongoing_costs': ongoing_costs,
-            'year1_net_savings': year1_net,
-            'year2plus_net_savings': year2plus_net,
-            'year1_roi_pct': year1_roi,
-            'ongoing_roi_pct': ongoing_roi,
-            'payback_months': payback_months,
-            'five_year_npv': npv,
-            'weekly_savings': annual_savings / 52,
-            'cost_breakdown': {
-                'current': current_costs,
-                'target': target_costs
-            }
-        }
+        # Hand out a fresh copy so callers can't modify the cached entry
+        breakdown = roi['cost_breakdown']
+        return dict(roi, cost_breakdown={
+            'current': dict(breakdown['current']),
+            'target': dict(breakdown['target'])
+        })
     
     def sensitivity_analysis(self) -> pd.DataFrame:
         """Perform sensitivity analysis on key variables"""
         
-        results = []
         base_roi = self.calculate_roi()['annual_savings']
         
-        # Variables to test
+        # Variables to test: state field, reduction levels, label
         variables = [
-            ('variance_reduction', [25, 50, 75], 'Variance Reduction %'),
-            ('overtime_reduction', [25, 50, 75], 'Overtime Reduction %'),
-            ('agency_reduction', [40, 60, 80], 'Agency Reduction %'),
-            ('turnover_reduction', [10, 20, 30], 'Turnover Reduction %')
+            ('variance_pct', [25, 50, 75], 'Variance Reduction %'),
+            ('overtime_pct', [25, 50, 75], 'Overtime Reduction %'),
+            ('agency_pct', [40, 60, 80], 'Agency Reduction %'),
+            ('turnover_rate', [10, 20, 30], 'Turnover Reduction %')
         ]
-        
-        for var_name, percentages, label in variables:
-            for pct in percentages:
-                # Save original state
-                original_current = self.current_state.copy()
-                original_target = self.target_state.copy()
-                
-                # Apply sensitivity
-                if var_name == 'variance_reduction':
-                    reduction = self.current_state['variance_pct'] * (pct / 100)
-                    self.target_state['variance_pct'] = self.current_state['variance_pct'] - reduction
-                elif var_name == 'overtime_reduction':
-                    reduction = self.current_state['overtime_pct'] * (pct / 100)
-                    self.target_state['overtime_pct'] = self.current_state['overtime_pct'] - reduction
-                elif var_name == 'agency_reduction':
-                    reduction = self.current_state['agency_pct'] * (pct / 100)
-                    self.target_state['agency_pct'] = self.current_state['agency_pct'] - reduction
-                elif var_name == 'turnover_reduction':
-                    reduction = self.current_state['turnover_rate'] * (pct / 100)
-                    self.target_state['turnover_rate'] = self.current_state['turnover_rate'] - reduction
-                
-                # Calculate new ROI
-                new_roi = self.calculate_roi()
-                
-                results.append({
-                    'Variable': label,
-                    'Change': f'{pct}%',
-                    'Annual Savings': new_roi['annual_savings'],
-                    'Impact vs Base': new_roi['annual_savings'] - base_roi
-                })
-                
-                # Restore original state
-                self.current_state = original_current
-                self.target_state = original_target
-        
-        return pd.DataFrame(results)
+        keys, percentages, labels = zip(*variables)
+        
+        # Annual savings are linear in each target-state field, so each row
+        # only needs the savings per percentage point of that field
+        coefficients = _memoized(_cost_coefficients, tuple(self.costs.items()), self.total_nurses)
+        savings_per_point = coefficients[[_STATE_KEYS.index(key) for key in keys], None]
+        
+        # Target for each row: the current level reduced by the tested percentage
+        pct = np.array(percentages)
+        current = np.array([self.current_state[key] for key in keys], dtype=float)[:, None]
+        target = np.array([self.target_state[key] for key in keys], dtype=float)[:, None]
+        sensitivity_target = current - current * (pct / 100)
+        impact = savings_per_point * (target - sensitivity_target)
+        
+        return pd.DataFrame({
+            'Variable': np.repeat(labels, pct.shape[1]),
+            'Change': [f'{p}%' for p in pct.ravel()],
+            'Annual Savings': (base_roi + impact).ravel(),
+            'Impact vs Base': impact.ravel()
+        })
     
-    def create_roi_visualization(self) -> plt.Figure:
+    def create_roi_visualization(self) -> "plt.Figure":
         """Create comprehensive ROI visualization"""
+        # Imported here so ROI calculations don't pay matplotlib's import cost
+        import matplotlib.pyplot as plt
         
         roi_data = self.calculate_roi()
         
@@ -257,20 +294,8 @@ class StaffingROICalculator:
         
         # 1. Cost comparison waterfall
         categories = ['Overtime', 'Agency', 'Turnover', 'Sick Calls', 'Productivity']
-        current_values = [
-            roi_data['cost_breakdown']['current']['overtime_premium'],
-            roi_data['cost_breakdown']['current']['agency_premium'],
-            roi_data['cost_breakdown']['current']['turnover_cost'],
-            roi_data['cost_breakdown']['current']['sick_call_cost'],
-            roi_data['cost_breakdown']['current']['productivity_loss']
-        ]
-        target_values = [
-            roi_data['cost_breakdown']['target']['overtime_premium'],
-            roi_data['cost_breakdown']['target']['agency_premium'],
-            roi_data['cost_breakdown']['target']['turnover_cost'],
-            roi_data['cost_breakdown']['target']['sick_call_cost'],
-            roi_data['cost_breakdown']['target']['productivity_loss']
-        ]
+        current_values = roi_data['cost_breakdown']['current']['components']
+        target_values = roi_data['cost_breakdown']['target']['components']
         
         x = np.arange(len(categories))
         width = 0.35
@@ -287,18 +312,11 @@ class StaffingROICalculator:
         
         # 2. Cumulative savings over 5 years
         years = np.arange(1, 6)
-        cumulative_savings = []
-        annual_savings = roi_data['annual_savings']
-        one_time = roi_data['one_time_investment']
-        ongoing = roi_data['ongoing_costs']
-        
-        for year in years:
-            if year == 1:
-                cumulative_savings.append(annual_savings - one_time - ongoing)
-            else:
-                cumulative_savings.append(cumulative_savings[-1] + annual_savings - ongoing)
-        
-        axes[0, 1].bar(years, cumulative_savings, color=['red' if x < 0 else 'green' for x in cumulative_savings])
+        annual_flows = np.full(len(years), roi_data['annual_savings'] - roi_data['ongoing_costs'])
+        annual_flows[0] -= roi_data['one_time_investment']
+        cumulative_savings = np.cumsum(annual_flows)
+        
+        axes[0, 1].bar(years, cumulative_savings, color=np.where(cumulative_savings < 0, 'red', 'green'))
         axes[0, 1].set_xlabel('Year')
         axes[0, 1].set_ylabel('Cumulative Savings ($)')
         axes[0, 1].set_title('5-Year Cumulative Savings')
@@ -359,73 +377,84 @@ class StaffingROICalculator:
         
         roi = self.calculate_roi()
         
-        summary = f"""
-STAFFING VARIANCE REDUCTION - ROI ANALYSIS
-{'='*60}
-
-FACILITY PROFILE
-----------------
-Hospital Size: {self.beds} beds
-Nursing Units: {self.units}
-Total Nursing FTEs: {self.total_nurses}
-
-CURRENT STATE ANALYSIS
-----------------------
-Staffing Variance: {self.current_state['variance_pct']}%
-Overtime Rate: {self.current_state['overtime_pct']}% of hours
-Agency Usage: {self.current_state['agency_pct']}% of hours
-Annual Turnover: {self.current_state['turnover_rate']}%
-
-Current Annual Cost of Variance: ${roi['current_annual_cost']:,.0f}
-
-PROPOSED INTERVENTION
----------------------
-Target Variance: {self.target_state['variance_pct']}%
-Target Overtime: {self.target_state['overtime_pct']}% of hours
-Target Agency: {self.target_state['agency_pct']}% of hours
-Target Turnover: {self.target_state['turnover_rate']}%
-
-Projected Annual Cost: ${roi['target_annual_cost']:,.0f}
-
-FINANCIAL ANALYSIS
-------------------
-Annual Savings: ${roi['annual_savings']:,.0f}
-Weekly Savings: ${roi['weekly_savings']:,.0f}
-
-Investment Required:
-  - One-time: ${roi['one_time_investment']:,.0f}
-  - Annual: ${roi['ongoing_costs']:,.0f}
-
-ROI METRICS
------------
-Year 1 ROI: {roi['year1_roi_pct']:.0f}%
-Ongoing Annual ROI: {roi['ongoing_roi_pct']:.0f}%
-Payback Period: {roi['payback_months']:.1f} months
-5-Year NPV (5% discount): ${roi['five_year_npv']:,.0f}
-
-SAVINGS BREAKDOWN
------------------
-Overtime Reduction: ${roi['cost_breakdown']['current']['overtime_premium'] - roi['cost_breakdown']['target']['overtime_premium']:,.0f}
-Agency Reduction: ${roi['cost_breakdown']['current']['agency_premium'] - roi['cost_breakdown']['target']['agency_premium']:,.0f}
-Turnover Reduction: ${roi['cost_breakdown']['current']['turnover_cost'] - roi['cost_breakdown']['target']['turnover_cost']:,.0f}
-Other Benefits: ${roi['cost_breakdown']['current']['sick_call_cost'] + roi['cost_breakdown']['current']['productivity_loss'] - roi['cost_breakdown']['target']['sick_call_cost'] - roi['cost_breakdown']['target']['productivity_loss']:,.0f}
-
-RECOMMENDATION
---------------
-With a payback period of {roi['payback_months']:.0f} months and ongoing ROI of {roi['ongoing_roi_pct']:.0f}%,
-this initiative represents a high-value investment in operational efficiency.
-
-Every week of delay costs approximately ${roi['weekly_savings']:,.0f}.
-
-NEXT STEPS
-----------
-1. Validate assumptions with your facility's data
-2. Identify pilot units for initial implementation
-3. Establish baseline metrics for tracking
-4. Begin vendor evaluation for predictive analytics platform
-"""
+        # Bind everything the report needs once
+        current, target = self.current_state, self.target_state
+        breakdown = roi['cost_breakdown']
+        savings = breakdown['current']['components'] - breakdown['target']['components']
+        overtime_savings, agency_savings, turnover_savings, sick_savings, productivity_savings = savings
+        weekly_savings = roi['weekly_savings']
+        payback_months = roi['payback_months']
+        ongoing_roi = roi['ongoing_roi_pct']
+        
+        parts = [
+            "",
+            "STAFFING VARIANCE REDUCTION - ROI ANALYSIS",
+            '=' * 60,
+            "",
+            "FACILITY PROFILE",
+            "----------------",
+            f"Hospital Size: {self.beds} beds",
+            f"Nursing Units: {self.units}",
+            f"Total Nursing FTEs: {self.total_nurses}",
+            "",
+            "CURRENT STATE ANALYSIS",
+            "----------------------",
+            f"Staffing Variance: {current['variance_pct']}%",
+            f"Overtime Rate: {current['overtime_pct']}% of hours",
+            f"Agency Usage: {current['agency_pct']}% of hours",
+            f"Annual Turnover: {current['turnover_rate']}%",
+            "",
+            f"Current Annual Cost of Variance: ${roi['current_annual_cost']:,.0f}",
+            "",
+            "PROPOSED INTERVENTION",
+            "---------------------",
+            f"Target Variance: {target['variance_pct']}%",
+            f"Target Overtime: {target['overtime_pct']}% of hours",
+            f"Target Agency: {target['agency_pct']}% of hours",
+            f"Target Turnover: {target['turnover_rate']}%",
+            "",
+            f"Projected Annual Cost: ${roi['target_annual_cost']:,.0f}",
+            "",
+            "FINANCIAL ANALYSIS",
+            "------------------",
+            f"Annual Savings: ${roi['annual_savings']:,.0f}",
+            f"Weekly Savings: ${weekly_savings:,.0f}",
+            "",
+            "Investment Required:",
+            f"  - One-time: ${roi['one_time_investment']:,.0f}",
+            f"  - Annual: ${roi['ongoing_costs']:,.0f}",
+            "",
+            "ROI METRICS",
+            "-----------",
+            f"Year 1 ROI: {roi['year1_roi_pct']:.0f}%",
+            f"Ongoing Annual ROI: {ongoing_roi:.0f}%",
+            f"Payback Period: {payback_months:.1f} months",
+            f"5-Year NPV (5% discount): ${roi['five_year_npv']:,.0f}",
+            "",
+            "SAVINGS BREAKDOWN",
+            "-----------------",
+            f"Overtime Reduction: ${overtime_savings:,.0f}",
+            f"Agency Reduction: ${agency_savings:,.0f}",
+            f"Turnover Reduction: ${turnover_savings:,.0f}",
+            f"Other Benefits: ${sick_savings + productivity_savings:,.0f}",
+            "",
+            "RECOMMENDATION",
+            "--------------",
+            f"With a payback period of {payback_months:.0f} months and ongoing ROI of {ongoing_roi:.0f}%,",
+            "this initiative represents a high-value investment in operational efficiency.",
+            "",
+            f"Every week of delay costs approximately ${weekly_savings:,.0f}.",
+            "",
+            "NEXT STEPS",
+            "----------",
+            "1. Validate assumptions with your facility's data",
+            "2. Identify pilot units for initial implementation",
+            "3. Establish baseline metrics for tracking",
+            "4. Begin vendor evaluation for predictive analytics platform",
+            "",
+        ]
         
-        return summary
+        return "\n".join(parts)
 
 
 def main():
@@ -449,7 +478,7 @@ def main():
     # Create visualizations
     print("\nGenerating ROI visualizations...")
     fig = calculator.create_roi_visualization()
-    plt.savefig('staffing_roi_analysis.png', dpi=300, bbox_inches='tight')
+    fig.savefig('staffing_roi_analysis.png', dpi=300, bbox_inches='tight')
     print("Saved: staffing_roi_analysis.png")
     
     # Perform sensitivity analysis
@@ -460,23 +489,12 @@ def main():
     
     # Create detailed breakdown
     roi_details = calculator.calculate_roi()
-    breakdown_df = pd.DataFrame([
-        {'Category': 'Overtime Premium', 
-         'Current': roi_details['cost_breakdown']['current']['overtime_premium'],
-         'Target': roi_details['cost_breakdown']['target']['overtime_premium']},
-        {'Category': 'Agency Premium',
-         'Current': roi_details['cost_breakdown']['current']['agency_premium'],
-         'Target': roi_details['cost_breakdown']['target']['agency_premium']},
-        {'Category': 'Turnover Cost',
-         'Current': roi_details['cost_breakdown']['current']['turnover_cost'],
-         'Target': roi_details['cost_breakdown']['target']['turnover_cost']},
-        {'Category': 'Excess Sick Calls',
-         'Current': roi_details['cost_breakdown']['current']['sick_call_cost'],
-         'Target': roi_details['cost_breakdown']['target']['sick_call_cost']},
-        {'Category': 'Productivity Loss',
-         'Current': roi_details['cost_breakdown']['current']['productivity_loss'],
-         'Target': roi_details['cost_breakdown']['target']['productivity_loss']}
-    ])
+    breakdown_df = pd.DataFrame({
+        'Category': ['Overtime Premium', 'Agency Premium', 'Turnover Cost',
+                     'Excess Sick Calls', 'Productivity Loss'],
+        'Current': roi_details['cost_breakdown']['current']['components'],
+        'Target': roi_details['cost_breakdown']['target']['components']
+    })
     breakdown_df['Savings'] = breakdown_df['Current'] - breakdown_df['Target']
     breakdown_df.to_csv('cost_breakdown.csv', index=False)
     print("Saved: cost_breakdown.csv")
@@ -27,64 +27,56 @@ class StaffingVarianceAnalyzer:
     
     def _generate_sample_data(self) -> pd.DataFrame:
         """Generate realistic sample staffing data"""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         dates = pd.date_range(start='2024-01-01', end='2024-06-30', freq='D')
+        n = len(dates)
         
-        data = []
-        for date in dates:
-            # Base patterns
-            dow = date.dayofweek
-            is_monday = dow == 0
-            is_weekend = dow >= 5
-            
-            # Census patterns (higher on Monday, lower on weekends)
-            base_census = 24
-            if is_monday:
-                census_modifier = 1.4  # 40% surge on Mondays
-            elif is_weekend:
-                census_modifier = 0.85
-            else:
-                census_modifier = 1.0
-            
-            # Add seasonality and randomness
-            seasonal_factor = 1 + 0.1 * np.sin(2 * np.pi * date.dayofyear / 365)
-            census = int(base_census * census_modifier * seasonal_factor + np.random.normal(0, 3))
-            census = max(15, min(35, census))  # Bounds
-            
-            # Scheduled staffing (often flat, not responsive to patterns)
-            scheduled_nurses = 6 if not is_weekend else 5
-            
-            # Actual staffing (reactive to census)
-            if census > 28:  # High census
-                actual_nurses = scheduled_nurses + np.random.choice([1, 2, 3], p=[0.5, 0.3, 0.2])
-                overtime_hours = np.random.uniform(4, 12) if actual_nurses > scheduled_nurses else 0
-                agency_hours = np.random.uniform(0, 12) if actual_nurses > scheduled_nurses + 1 else 0
-            elif census < 20:  # Low census  
-                actual_nurses = scheduled_nurses - np.random.choice([0, 1], p=[0.7, 0.3])
-                overtime_hours = 0
-                agency_hours = 0
-            else:  # Normal census
-                actual_nurses = scheduled_nurses
-                overtime_hours = np.random.uniform(0, 4) if np.random.random() > 0.7 else 0
-                agency_hours = 0
-            
-            # Required staffing based on ratios (1:4 ratio)
-            required_nurses = np.ceil(census / 4)
-            
-            data.append({
-                'date': date,
-                'unit': 'Med-Surg-1',
-                'shift': 'Day',
-                'census': census,
-                'scheduled_nurses': scheduled_nurses,
-                'actual_nurses': actual_nurses,
-                'required_nurses': required_nurses,
-                'overtime_hours': overtime_hours,
-                'agency_hours': agency_hours,
-                'sick_calls': 1 if np.random.random() > 0.9 else 0
-            })
-        
-        return pd.DataFrame(data)
+        # Base patterns
+        dow = dates.dayofweek.values
+        is_weekend = dow >= 5
+        
+        # Census patterns (higher on Monday, lower on weekends)
+        base_census = 24
+        census_modifier = np.where(dow == 0, 1.4, np.where(is_weekend, 0.85, 1.0))  # 40% surge on Mondays
+        
+        # Add seasonality and randomness
+        seasonal_factor = 1 + 0.1 * np.sin(2 * np.pi * dates.dayofyear.values / 365)
+        census = (base_census * census_modifier * seasonal_factor + rng.normal(0, 3, n)).astype(int)
+        census = np.clip(census, 15, 35)  # Bounds
+        
+        # Scheduled staffing (often flat, not responsive to patterns)
+        scheduled_nurses = np.where(is_weekend, 5, 6)
+        
+        # Actual staffing (reactive to census)
+        high = census > 28  # High census
+        low = census < 20  # Low census
+        normal = ~(high | low)
+        
+        extra_nurses = rng.choice([1, 2, 3], size=n, p=[0.5, 0.3, 0.2])
+        fewer_nurses = rng.choice([0, 1], size=n, p=[0.7, 0.3])
+        actual_nurses = scheduled_nurses + np.where(high, extra_nurses, 0) - np.where(low, fewer_nurses, 0)
+        
+        # High census always adds staff (overtime); two or more extra also brings agency.
+        # Normal census sees occasional short overtime.
+        overtime_hours = np.where(high, rng.uniform(4, 12, n), 0.0)
+        overtime_hours = np.where(normal & (rng.random(n) > 0.7), rng.uniform(0, 4, n), overtime_hours)
+        agency_hours = np.where(high & (extra_nurses > 1), rng.uniform(0, 12, n), 0.0)
+        
+        # Required staffing based on ratios (1:4 ratio)
+        required_nurses = np.ceil(census / 4)
+        
+        return pd.DataFrame({
+            'date': dates,
+            'unit': 'Med-Surg-1',
+            'shift': 'Day',
+            'census': census,
+            'scheduled_nurses': scheduled_nurses,
+            'actual_nurses': actual_nurses,
+            'required_nurses': required_nurses,
+            'overtime_hours': overtime_hours,
+            'agency_hours': agency_hours,
+            'sick_calls': (rng.random(n) > 0.9).astype(int)
+        })
     
     def calculate_variance(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate staffing variance metrics"""